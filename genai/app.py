@@ -14,7 +14,7 @@ import structlog
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, HTTPException, Path, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
@@ -31,8 +31,10 @@ from src.models import (
     HealthResponse,
     IngestTaskResponse,
     IngestTaskStatus,
+    QuestionChunk,
     QuestionRequest,
     QuestionResponse,
+    SummaryChunk,
 )
 from src.services import (
     ContributionsIngestionService,
@@ -50,6 +52,7 @@ DEFAULT_MODEL_NAME = "llama3.3:latest"
 # Service error messages
 SERVICE_NOT_INITIALIZED = "Service not initialized"
 INGESTION_TASK_FAILED = "Failed to start ingestion task"
+QUESTION_STREAM_FAILED = "Streaming question answering failed"
 SUMMARY_GENERATION_FAILED = "Streaming summary generation failed"
 
 load_dotenv()
@@ -387,7 +390,11 @@ async def ask_question_about_user_contributions(
         if not meilisearch_service:
             raise HTTPException(status_code=503, detail="Meilisearch service not initialized")
 
-        service = QuestionAnsweringService(github_content_service, meilisearch_service)
+        service = QuestionAnsweringService(
+            github_content_service,
+            meilisearch_service,
+            ingestion_service=services.ingestion_service,
+        )
 
         result = await service.answer_question(username, week_id, request)
 
@@ -415,6 +422,74 @@ async def ask_question_about_user_contributions(
         raise HTTPException(status_code=500, detail=f"Failed to answer question: {e!s}")
 
 
+@app.post("/users/{username}/weeks/{week_id}/questions/stream")
+async def stream_answer_about_user_contributions(
+    request: QuestionRequest,
+    username: str = Path(..., description="GitHub username"),
+    week_id: str = Path(..., description="ISO week format: 2024-W21"),
+) -> StreamingResponse:
+    """Ask a question and stream the answer as server-sent events.
+
+    Each event is a JSON ``QuestionChunk``: ``content`` chunks carry answer text as it is
+    generated, followed by a ``complete`` chunk with the full response (or an ``error`` chunk).
+    """
+    meilisearch_service = services.meilisearch_service
+    if not meilisearch_service:
+        raise HTTPException(status_code=503, detail="Meilisearch service not initialized")
+
+    pat = request.github_pat or os.getenv("GITHUB_TOKEN")
+    service = QuestionAnsweringService(
+        GitHubContentService(pat),
+        meilisearch_service,
+        ingestion_service=services.ingestion_service,
+    )
+
+    async def event_stream() -> AsyncGenerator[str, None]:
+        try:
+            async for chunk in service.answer_question_stream(username, week_id, request):
+                yield f"data: {chunk.model_dump_json()}\n\n"
+        except Exception as e:
+            logger.exception(
+                QUESTION_STREAM_FAILED,
+                username=username,
+                week_id=week_id,
+                question=request.question[:100],
+                error=str(e),
+            )
+            error_chunk = QuestionChunk(chunk_type="error", content=f"Failed to answer question: {e!s}")
+            yield f"data: {error_chunk.model_dump_json()}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+# Summary endpoints
+@app.get("/users/{username}/weeks/{week_id}/summary/stream")
+async def stream_summary_of_user_contributions(
+    username: str = Path(..., description="GitHub username"),
+    week_id: str = Path(..., description="ISO week format: 2024-W21"),
+) -> StreamingResponse:
+    """Generate a weekly progress report from ingested contributions, streamed as server-sent events.
+
+    Each event is a JSON ``SummaryChunk``: a ``metadata`` chunk, the ``overview`` and ``analysis``
+    sections, further analysis text as ``content`` chunks, then a ``complete`` chunk with the
+    full summary (or an ``error`` chunk).
+    """
+    summary_service = services.summary_service
+    if not summary_service:
+        raise HTTPException(status_code=503, detail=SERVICE_NOT_INITIALIZED)
+
+    async def event_stream() -> AsyncGenerator[str, None]:
+        try:
+            async for chunk in summary_service.generate_summary_stream(username, week_id):
+                yield f"data: {chunk.model_dump_json()}\n\n"
+        except Exception as e:
+            logger.exception(SUMMARY_GENERATION_FAILED, username=username, week_id=week_id, error=str(e))
+            error_chunk = SummaryChunk(chunk_type="error", content=f"Failed to generate summary: {e!s}")
+            yield f"data: {error_chunk.model_dump_json()}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 # API documentation endpoints
 @app.get("/openapi.json", include_in_schema=False, response_class=JSONResponse)
 async def get_openapi_documentation() -> JSONResponse:
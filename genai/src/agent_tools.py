@@ -6,9 +6,9 @@ to search and retrieve information from GitHub repositories.
 The tools are built on top of the GitHubContentService.
 """
 
-import json
 from typing import Any
 
+import orjson
 from langchain.tools import tool
 
 from .contributions import GitHubContentService
@@ -30,7 +30,7 @@ def create_agent_tools(github_pat: str | None = None) -> list[Any]:
             return "No code results found."
         # Return a subset of fields to avoid being too verbose.
         filtered_results = [{"path": r["path"], "url": r["html_url"]} for r in results]
-        return json.dumps(filtered_results, indent=2)
+        return orjson.dumps(filtered_results).decode()
 
     @tool
     async def search_github_issues(repository: str, query: str, is_open: bool | None = None) -> str:
@@ -51,7 +51,7 @@ def create_agent_tools(github_pat: str | None = None) -> list[Any]:
             }
             for r in results
         ]
-        return json.dumps(filtered_results, indent=2)
+        return orjson.dumps(filtered_results).decode()
 
     @tool
     async def search_github_pull_requests(repository: str, query: str, is_open: bool | None = None) -> str:
@@ -72,7 +72,7 @@ def create_agent_tools(github_pat: str | None = None) -> list[Any]:
             }
             for r in results
         ]
-        return json.dumps(filtered_results, indent=2)
+        return orjson.dumps(filtered_results).decode()
 
     @tool
     async def get_github_file_content(repository: str, file_path: str) -> str:
@@ -89,7 +89,7 @@ def create_agent_tools(github_pat: str | None = None) -> list[Any]:
         """Gets detailed information for a specific commit using its SHA."""
         commit = await github_service.get_commit_details(repository, sha)
         if commit:
-            return commit.model_dump_json(indent=2)
+            return commit.model_dump_json(exclude_none=True)
         return "Commit not found."
 
     @tool
@@ -97,7 +97,7 @@ def create_agent_tools(github_pat: str | None = None) -> list[Any]:
         """Gets detailed information for a specific issue using its number."""
         issue = await github_service.get_issue_details(repository, str(issue_number))
         if issue:
-            return issue.model_dump_json(indent=2)
+            return issue.model_dump_json(exclude_none=True)
         return "Issue not found."
 
     @tool
@@ -105,7 +105,7 @@ def create_agent_tools(github_pat: str | None = None) -> list[Any]:
         """Gets detailed information for a specific pull request using its number."""
         pr = await github_service.get_pull_request_details(repository, str(pr_number))
         if pr:
-            return pr.model_dump_json(indent=2)
+            return pr.model_dump_json(exclude_none=True)
         return "Pull request not found."
 
     return [
@@ -128,16 +128,15 @@ class GitHubContentService:
             metadata_by_type[contrib_type].append(metadata)
 
         # Fetch each type of contribution
+        fetchers = {
+            ContributionType.COMMIT: self._fetch_commits_by_metadata,
+            ContributionType.PULL_REQUEST: self._fetch_pull_requests_by_metadata,
+            ContributionType.ISSUE: self._fetch_issues_by_metadata,
+            ContributionType.RELEASE: self._fetch_releases_by_metadata,
+        }
         for contrib_type, type_metadata in metadata_by_type.items():
             try:
-                if contrib_type == ContributionType.COMMIT:
-                    contributions.extend(await self._fetch_commits_by_metadata(repository, type_metadata))
-                elif contrib_type == ContributionType.PULL_REQUEST:
-                    contributions.extend(await self._fetch_pull_requests_by_metadata(repository, type_metadata))
-                elif contrib_type == ContributionType.ISSUE:
-                    contributions.extend(await self._fetch_issues_by_metadata(repository, type_metadata))
-                elif contrib_type == ContributionType.RELEASE:
-                    contributions.extend(await self._fetch_releases_by_metadata(repository, type_metadata))
+                contributions.extend(await fetchers[contrib_type](repository, type_metadata))
             except Exception as e:
                 logger.exception(
                     "Error fetching contributions by type",
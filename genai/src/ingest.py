@@ -1,8 +1,12 @@
 import asyncio
+import os
+import time
+from collections import Counter
 from datetime import UTC, datetime
 from typing import Any
 
 import structlog
+from cachetools import LRUCache, TTLCache
 
 from .contributions import GitHubContentService
 from .meilisearch import MeilisearchService
@@ -25,9 +29,25 @@ from .models import (
     generate_uuidv7,
 )
 from .summary import SummaryService
+from .text_utils import tokenize_words
 
 logger = structlog.get_logger()
 
+# Finished task and job records are only polled for a while; expire them so they cannot accumulate forever
+INGEST_TASKS_MAX_ENTRIES = int(os.getenv("INGEST_TASKS_MAX_ENTRIES", "10000"))
+INGEST_TASKS_TTL_SECONDS = int(os.getenv("INGEST_TASKS_TTL_SECONDS", "86400"))
+
+# Extracted text is derived from stored contributions, so it can be recomputed after eviction
+INGEST_TEXT_CACHE_MAX_ENTRIES = int(os.getenv("INGEST_TEXT_CACHE_MAX_ENTRIES", "10000"))
+
+# Attribute holding the display title of each contribution type (matches the Meilisearch document title)
+TITLE_ATTRIBUTES = {
+    ContributionType.COMMIT: "message",
+    ContributionType.PULL_REQUEST: "title",
+    ContributionType.ISSUE: "title",
+    ContributionType.RELEASE: "name",
+}
+
 
 class ContributionsIngestionService:
     """Service for ingesting GitHub contributions using metadata and fetching content as needed."""
@@ -37,10 +57,22 @@ class ContributionsIngestionService:
         meilisearch_service: MeilisearchService | None = None,
         summary_service: SummaryService | None = None,
     ) -> None:
-        # Store contributions by [user, week] key
+        # Store contributions by [user, week] key. Not bounded: summaries and the keyword fallback read weeks
+        # only from here (Meilisearch documents hold search text, not full contributions)
         self.contributions_store: dict[str, dict[str, GitHubContribution]] = {}
-        self.embedding_jobs: dict[str, dict[str, Any]] = {}
-        self.ingest_tasks: dict[str, IngestTaskStatus] = {}  # Track ingestion tasks
+        self.embedding_jobs: TTLCache[str, dict[str, Any]] = TTLCache(
+            maxsize=INGEST_TASKS_MAX_ENTRIES, ttl=INGEST_TASKS_TTL_SECONDS
+        )
+        # Track ingestion tasks
+        self.ingest_tasks: TTLCache[str, IngestTaskStatus] = TTLCache(
+            maxsize=INGEST_TASKS_MAX_ENTRIES, ttl=INGEST_TASKS_TTL_SECONDS
+        )
+        # Extracted text content by contribution id
+        self._text_cache: LRUCache[str, str] = LRUCache(maxsize=INGEST_TEXT_CACHE_MAX_ENTRIES)
+        # Keyword search state per [user, week] key, kept as long as the week's contributions:
+        # lowercased tokens by contribution id, and the inverted index token -> ids containing it
+        self._token_sets: dict[str, dict[str, frozenset[str]]] = {}
+        self._week_indexes: dict[str, dict[str, set[str]]] = {}
         self.meilisearch_service = meilisearch_service
         self.summary_service = summary_service  # Will be injected to avoid circular imports
 
@@ -92,6 +124,7 @@ class ContributionsIngestionService:
         summary_id: str | None = None,
     ) -> None:
         """Process the full ingestion and summarization task asynchronously."""
+        start_ns = time.monotonic_ns()
         try:
             # Phase 1: Start ingesting
             if task_id in self.ingest_tasks:
@@ -170,12 +203,8 @@ class ContributionsIngestionService:
             if task_id in self.ingest_tasks:
                 self.ingest_tasks[task_id].status = TaskStatus.DONE
                 self.ingest_tasks[task_id].completed_at = datetime.now(UTC)
-
-                started_at = self.ingest_tasks[task_id].started_at
-                completed_at = self.ingest_tasks[task_id].completed_at
-                if started_at and completed_at:
-                    processing_time = completed_at - started_at
-                    self.ingest_tasks[task_id].processing_time_ms = int(processing_time.total_seconds() * 1000)
+                # Monotonic, so wall-clock adjustments during the task cannot skew the duration
+                self.ingest_tasks[task_id].processing_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
             logger.info(
                 "Full task completed successfully",
@@ -267,15 +296,14 @@ class ContributionsIngestionService:
         failed_count = 0
         embedding_job_id = generate_uuidv7()
 
-        # Initialize storage for this user-week if not exists
-        if user_week_key not in self.contributions_store:
-            self.contributions_store[user_week_key] = {}
-
         # Process each contribution
         for contribution in contributions:
             try:
-                # Store contribution with user-week context
-                self.contributions_store[user_week_key][contribution.id] = contribution
+                # Store contribution with user-week context; the week may have been cleared while awaiting
+                self.contributions_store.setdefault(user_week_key, {})[contribution.id] = contribution
+                # Re-ingested contributions may have changed; drop text derived from the old version
+                self._text_cache.pop(contribution.id, None)
+                self._index_contribution(user_week_key, contribution)
 
                 # Prepare for embedding (placeholder)
                 await self._prepare_for_embedding(contribution, user, week)
@@ -319,7 +347,14 @@ class ContributionsIngestionService:
         )
 
     def _extract_text_content(self, contribution: GitHubContribution) -> str:
-        """Extract searchable text content from contribution."""
+        """Extract searchable text content from contribution.
+
+        The result is cached by contribution id until the contribution is ingested again.
+        """
+        cached_text = self._text_cache.get(contribution.id)
+        if cached_text is not None:
+            return cached_text
+
         content_parts = []
 
         # Common fields
@@ -375,7 +410,71 @@ class ContributionsIngestionService:
             if hasattr(contribution, "body") and contribution.body:
                 content_parts.append(f"Release Notes: {contribution.body}")
 
-        return "\n".join(content_parts)
+        text = "\n".join(content_parts)
+        self._text_cache[contribution.id] = text
+        return text
+
+    def _extract_contribution_title(self, contribution: GitHubContribution) -> str:
+        """Extract a display title from a contribution, matching the Meilisearch document title."""
+        attribute = TITLE_ATTRIBUTES.get(contribution.type)
+        if attribute is None:
+            return ""
+        title: str = getattr(contribution, attribute, "")
+        return title
+
+    def _tokenize(self, text: str) -> frozenset[str]:
+        """Split text into the lowercased token set used for keyword search."""
+        return frozenset(tokenize_words(text))
+
+    def _index_contribution(self, user_week_key: str, contribution: GitHubContribution) -> None:
+        """Add a contribution's tokens to its week's keyword index, replacing any previous version."""
+        week_index = self._week_indexes.setdefault(user_week_key, {})
+        token_sets = self._token_sets.setdefault(user_week_key, {})
+
+        for token in token_sets.get(contribution.id, ()):
+            postings = week_index.get(token)
+            if postings is not None:
+                postings.discard(contribution.id)
+                if not postings:
+                    del week_index[token]
+
+        tokens = self._tokenize(self._extract_text_content(contribution))
+        token_sets[contribution.id] = tokens
+        for token in tokens:
+            week_index.setdefault(token, set()).add(contribution.id)
+
+    def search_contributions(self, user: str, week: str, query: str, limit: int = 10) -> list[dict[str, Any]]:
+        """Keyword search over a user's week held in memory.
+
+        Used when Meilisearch is unavailable. Hits have the same shape as Meilisearch hits, with
+        ``relevance_score`` set to the fraction of query tokens found in the contribution.
+        """
+        query_tokens = self._tokenize(query)
+        user_week_key = self._get_user_week_key(user, week)
+        week_index = self._week_indexes.get(user_week_key)
+        if not query_tokens or not week_index:
+            return []
+
+        # Only contributions sharing at least one token with the query are ever touched
+        matches: Counter[str] = Counter()
+        for token in query_tokens:
+            matches.update(week_index.get(token, ()))
+
+        contributions = self.contributions_store.get(user_week_key, {})
+        hits = []
+        for contribution_id, matched in matches.most_common(limit):
+            contribution = contributions[contribution_id]
+            hits.append(
+                {
+                    "contribution_id": contribution.id,
+                    "contribution_type": contribution.type.value,
+                    "title": self._extract_contribution_title(contribution),
+                    "content": self._extract_text_content(contribution),
+                    "created_at": contribution.created_at.isoformat(),
+                    "relevance_score": matched / len(query_tokens),
+                }
+            )
+        return hits
 
     async def _process_embeddings(
         self, job_id: str, contributions: list[GitHubContribution], user: str, week: str
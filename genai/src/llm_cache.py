@@ -0,0 +1,106 @@
+"""Response cache for LLM-backed operations.
+
+Entries are keyed by a stable hash of everything that influenced the prompt
+(user, week, question, evidence identifiers, model, ...), so a hit can skip the
+LLM round-trip entirely. The in-memory backend is an LRU with per-entry TTL.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+import structlog
+
+from .metrics import cache_hit_rate
+
+logger = structlog.get_logger()
+
+# Cache defaults
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CACHE_TTL_SECONDS = 3600
+
+
+def make_cache_key(**parts: Any) -> str:
+    """Build a deterministic SHA-256 cache key from the given keyword parts.
+
+    Args:
+        **parts: JSON-serialisable values that uniquely identify a prompt.
+
+    Returns:
+        Hex digest of the canonical JSON encoding of ``parts``.
+    """
+    payload = orjson.dumps(parts, default=str, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(payload).hexdigest()
+
+
+class LLMCache:
+    """LRU + TTL cache for LLM responses.
+
+    The interface is async so that a shared backend (e.g. Redis) can be swapped
+    in without touching call sites.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            name: Operation name used for the cache hit rate metric.
+            max_entries: Maximum number of entries before the least recently used is evicted.
+            ttl_seconds: Default time-to-live for entries.
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of (possibly expired) entries held."""
+        return len(self._entries)
+
+    async def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key`` or ``None`` on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._record(hit=True)
+                return value
+            del self._entries[key]
+
+        self._record(hit=False)
+        return None
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entries if full."""
+        expires_at = time.monotonic() + (self.ttl_seconds if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        """Drop all entries and reset hit statistics."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _record(self, *, hit: bool) -> None:
+        """Update hit/miss counters and the exported hit rate."""
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+
+        cache_hit_rate.labels(operation=self.name).set(self._hits / (self._hits + self._misses))
+        logger.debug("LLM cache lookup", cache=self.name, hit=hit, size=len(self._entries))
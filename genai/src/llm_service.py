@@ -1,16 +1,109 @@
 """LLM service for centralized language model configuration and initialization."""
 
+import asyncio
 import os
-from typing import cast
+from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
+from typing import Any, cast
+from urllib.parse import urlparse
 
 import structlog
+from cachetools import LRUCache
 from langchain.chat_models.base import BaseChatModel
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_core.runnables import RunnableBinding
 from langchain_ollama import ChatOllama
 from langchain_openai import ChatOpenAI
 from pydantic import SecretStr
 
 logger = structlog.get_logger()
 
+# Maximum in-flight LLM requests per model, shared by all services in the process
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "10"))
+_llm_semaphores: dict[str, asyncio.Semaphore] = {}
+
+# prompt_cache_key is an api.openai.com extension; OpenAI-compatible endpoints (Azure, proxies) may reject it
+OPENAI_API_HOST = "api.openai.com"
+
+# LLM instances reused by services that are constructed per request, by configuration
+LLM_SHARED_MAX_ENTRIES = int(os.getenv("LLM_SHARED_MAX_ENTRIES", "32"))
+_shared_llms: LRUCache[tuple[object, ...], BaseChatModel] = LRUCache(maxsize=LLM_SHARED_MAX_ENTRIES)
+
+
+class ConcurrencyLimitedChatModel(BaseChatModel):
+    """Chat model holding its model's concurrency slot only while a request to the wrapped model runs.
+
+    Agents interleave LLM calls with tool calls, so limiting the whole run would keep a slot
+    busy during slow GitHub lookups. Only async calls are limited; sync calls pass through.
+    """
+
+    llm: BaseChatModel
+
+    @property
+    def _llm_type(self) -> str:
+        return self.llm._llm_type
+
+    @property
+    def _identifying_params(self) -> Mapping[str, Any]:
+        return self.llm._identifying_params
+
+    def _should_stream(
+        self,
+        *,
+        async_api: bool,
+        run_manager: CallbackManagerForLLMRun | AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> bool:
+        return self.llm._should_stream(async_api=async_api, run_manager=run_manager, **kwargs)
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return self.llm._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        async with LLMService.concurrency_limit():
+            return await self.llm._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        return self.llm._stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        async with LLMService.concurrency_limit():
+            async for chunk in self.llm._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                yield chunk
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> Any:
+        """Bind tools to the wrapped model, keeping its calls behind the concurrency limit."""
+        bound = self.llm.bind_tools(tools, **kwargs)
+        if isinstance(bound, RunnableBinding):
+            # Providers bind tools as call arguments, which are forwarded to the wrapped model
+            return self.bind(**bound.kwargs)
+        return self.model_copy(update={"llm": bound})
+
 
 class LLMService:
     """Centralized service for language model configuration and initialization."""
@@ -34,6 +127,7 @@ class LLMService:
         max_tokens: int | None = None,
         timeout: float = 60.0,
         model_override: str | None = None,
+        prompt_cache_key: str | None = None,
     ) -> BaseChatModel:
         """Create an LLM instance based on available API keys.
 
@@ -46,6 +140,7 @@ class LLMService:
             max_tokens: Maximum tokens to generate (None for unlimited)
             timeout: Request timeout in seconds
             model_override: Override the default model name
+            prompt_cache_key: OpenAI prompt cache routing key for requests sharing a static prefix
 
         Returns:
             Configured LLM instance (ChatOpenAI, or ChatOllama)
@@ -63,6 +158,7 @@ class LLMService:
                 max_tokens=max_tokens,
                 timeout=timeout,
                 model_override=model_override,
+                prompt_cache_key=prompt_cache_key,
             )
 
         # Fall back to Ollama
@@ -84,18 +180,84 @@ class LLMService:
         raise ValueError(msg)
 
     @staticmethod
-    def _create_openai_llm(
+    def shared_llm_key(
+        temperature: float = 0.2,
+        max_tokens: int | None = None,
+        timeout: float = 60.0,
+        model_override: str | None = None,
+        prompt_cache_key: str | None = None,
+    ) -> tuple[object, ...]:
+        """Identify the configuration ``get_shared_llm`` would return an instance for.
+
+        Unlike the instance itself, the key stays valid after the instance is evicted and rebuilt.
+        """
+        return (
+            LLMService.get_llm_provider(),
+            model_override or LLMService.get_current_model_name(),
+            temperature,
+            max_tokens,
+            timeout,
+            prompt_cache_key,
+        )
+
+    @staticmethod
+    def get_shared_llm(
+        temperature: float = 0.2,
+        max_tokens: int | None = None,
+        timeout: float = 60.0,
+        model_override: str | None = None,
+        prompt_cache_key: str | None = None,
+    ) -> BaseChatModel:
+        """Get a process-wide LLM instance, creating it on first use.
+
+        Takes the same arguments as ``create_llm``. Instances are reused per configuration
+        and provider, so their HTTP clients and connection pools are shared across requests.
+        Beyond ``LLM_SHARED_MAX_ENTRIES`` configurations the least recently used one is dropped.
+        """
+        key = LLMService.shared_llm_key(
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=timeout,
+            model_override=model_override,
+            prompt_cache_key=prompt_cache_key,
+        )
+        llm = _shared_llms.get(key)
+        if llm is None:
+            llm = LLMService.create_llm(
+                temperature=temperature,
+                max_tokens=max_tokens,
+                timeout=timeout,
+                model_override=model_override,
+                prompt_cache_key=prompt_cache_key,
+            )
+            _shared_llms[key] = llm
+        return llm
+
+    @staticmethod
+    def _create_openai_llm(  # noqa: PLR0913
         api_key: str,
+        *,
         temperature: float,
         max_tokens: int | None,
         timeout: float,
         model_override: str | None,
+        prompt_cache_key: str | None = None,
     ) -> ChatOpenAI:
         """Create ChatOpenAI instance."""
         model_name = cast("str", model_override or os.getenv("OPENAI_MODEL_NAME", "gpt-4o-mini"))
 
+        # Ollama has no equivalent; its KV cache reuse is implicit for identical prefixes
+        model_kwargs: dict[str, object] = {}
+        base_url = os.getenv("OPENAI_BASE_URL") or os.getenv("OPENAI_API_BASE")
+        if prompt_cache_key and (not base_url or urlparse(base_url).hostname == OPENAI_API_HOST):
+            model_kwargs["prompt_cache_key"] = prompt_cache_key
+
         openai_instance = ChatOpenAI(
-            model=model_name, api_key=SecretStr(api_key), temperature=temperature, timeout=timeout
+            model=model_name,
+            api_key=SecretStr(api_key),
+            temperature=temperature,
+            timeout=timeout,
+            model_kwargs=model_kwargs,
         )
 
         if max_tokens is not None:
@@ -177,6 +339,48 @@ class LLMService:
             ],
         }
 
+    @staticmethod
+    def with_max_tokens(llm: BaseChatModel, max_tokens: int) -> BaseChatModel:
+        """Return a copy of an LLM with a different output token limit.
+
+        Args:
+            llm: LLM instance created by ``create_llm``
+            max_tokens: Maximum tokens to generate
+
+        Returns:
+            Copy of ``llm`` sharing its client but capped at ``max_tokens``
+        """
+        # For Ollama, use num_predict instead of max_tokens
+        field = "num_predict" if isinstance(llm, ChatOllama) else "max_tokens"
+        return llm.model_copy(update={field: max_tokens})
+
+    @staticmethod
+    def with_concurrency_limit(llm: BaseChatModel) -> BaseChatModel:
+        """Wrap an LLM so each async request to it waits for a slot of ``concurrency_limit()``.
+
+        Args:
+            llm: LLM instance created by ``create_llm``
+
+        Returns:
+            Wrapper holding the slot per request rather than for a whole agent run
+        """
+        return ConcurrencyLimitedChatModel(llm=llm)
+
+    @staticmethod
+    def concurrency_limit(model_name: str | None = None) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent requests to a model.
+
+        Args:
+            model_name: Model to limit; defaults to the current provider's model.
+
+        Returns:
+            Semaphore shared by every caller of the same model.
+        """
+        model = model_name or LLMService.get_current_model_name()
+        if model not in _llm_semaphores:
+            _llm_semaphores[model] = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+        return _llm_semaphores[model]
+
     @staticmethod
     def get_current_model_name() -> str:
         """Get the model name that would be used by the current provider."""
@@ -1,20 +1,35 @@
 import asyncio
 import os
 from datetime import datetime  # noqa: F401
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 import structlog
 
 import meilisearch
 from meilisearch.errors import MeilisearchApiError
 
+from .llm_cache import LLMCache, make_cache_key
 from .models import ContributionType, GitHubContribution
+from .text_utils import normalize_text
 
 if TYPE_CHECKING:
     from meilisearch.index import Index
 
 logger = structlog.get_logger()
 
+# Repeated questions over the same week reuse the previous hits instead of re-embedding the query
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("MEILISEARCH_SEARCH_CACHE_MAX_ENTRIES", "1024"))
+SEARCH_CACHE_TTL_SECONDS = int(os.getenv("MEILISEARCH_SEARCH_CACHE_TTL_SECONDS", "300"))
+
+# Fields callers read from search hits; everything else (patches, bodies, vectors) stays server-side
+SEARCH_RESULT_ATTRIBUTES = [
+    "contribution_id",
+    "contribution_type",
+    "title",
+    "content",
+    "created_at",
+]
+
 
 class MeilisearchService:
     """Service for managing Meilisearch operations for GitHub contributions."""
@@ -28,6 +43,10 @@ class MeilisearchService:
         self.contributions_index_name = "contributions"
         self.contributions_index: Index | None = None
 
+        # Search results are keyed by a per user-week generation that is bumped on every write
+        self.search_cache = LLMCache("meilisearch_search", SEARCH_CACHE_MAX_ENTRIES, SEARCH_CACHE_TTL_SECONDS)
+        self._index_generations: dict[str, int] = {}
+
     async def initialize(self) -> bool:
         """Initialize Meilisearch indices and settings."""
         try:
@@ -83,6 +102,7 @@ class MeilisearchService:
 
             # Wait for indexing to complete
             await asyncio.to_thread(self.client.wait_for_task, task.task_uid)
+            self._invalidate_search_cache(user, week)
 
             # Get task details
             task_info = await asyncio.to_thread(self.client.get_task, task.task_uid)
@@ -135,8 +155,8 @@ class MeilisearchService:
         # Type-specific content
         title = ""
         body = ""
-        filename = ""
-        patch = ""
+        filenames: list[str] = []
+        patches: list[str] = []
 
         if contribution.type == ContributionType.COMMIT:
             if hasattr(contribution, "message"):
@@ -147,10 +167,10 @@ class MeilisearchService:
             if hasattr(contribution, "files"):
                 for file in contribution.files:
                     content_parts.append(f"File: {file.filename}")
-                    filename += f"{file.filename} "
+                    filenames.append(file.filename)
                     if file.patch:
-                        content_parts.append(f"Changes: {file.patch[:500]}")
-                        patch += f"{file.patch[:500]} "
+                        patches.append(file.patch[:500])
+                        content_parts.append(f"Changes: {patches[-1]}")
 
         elif contribution.type == ContributionType.PULL_REQUEST:
             if hasattr(contribution, "title"):
@@ -211,8 +231,8 @@ class MeilisearchService:
             "title": title,
             "message": getattr(contribution, "message", ""),
             "body": body,
-            "filename": filename.strip(),
-            "patch": patch.strip(),
+            "filename": " ".join(filenames).strip(),
+            "patch": " ".join(patches).strip(),
             "content": "\n".join(content_parts),
             "relevance_score": 1.0,  # Default relevance score
             "is_selected": getattr(contribution, "is_selected", True),  # Default to True if not present
@@ -224,6 +244,17 @@ class MeilisearchService:
             msg = "Meilisearch service not initialized"
             raise ValueError(msg)
 
+        cache_key = make_cache_key(
+            user=user,
+            week=week,
+            query=normalize_text(query),
+            limit=limit,
+            generation=self._index_generations.get(f"{user}:{week}", 0),
+        )
+        cached_hits = await self.search_cache.get(cache_key)
+        if cached_hits is not None:
+            return cast("list[dict[str, Any]]", cached_hits)
+
         try:
             # Build search filters
             filters = f'user = "{user}" AND week = "{week}"'
@@ -233,9 +264,8 @@ class MeilisearchService:
             search_params = {
                 "filter": filters,
                 "limit": limit,
-                "attributesToHighlight": ["content", "title", "message", "body"],
-                "highlightPreTag": "<mark>",
-                "highlightPostTag": "</mark>",
+                "attributesToRetrieve": SEARCH_RESULT_ATTRIBUTES,
+                "showRankingScore": True,
                 "sort": ["created_at_timestamp:desc"],
             }
 
@@ -261,7 +291,12 @@ class MeilisearchService:
                 search_type="hybrid" if ollama_api_key else "full-text",
             )
 
-            return search_results["hits"]
+            hits: list[dict[str, Any]] = search_results["hits"]
+            # The stored relevance_score is a constant placeholder; use how well each hit actually matched
+            for hit in hits:
+                hit["relevance_score"] = hit.pop("_rankingScore", 1.0)
+            await self.search_cache.set(cache_key, hits)
+            return hits
 
         except Exception as e:
             logger.exception(
@@ -273,6 +308,11 @@ class MeilisearchService:
             )
             raise
 
+    def _invalidate_search_cache(self, user: str, week: str) -> None:
+        """Make cached searches for a user's week stale after its documents change."""
+        key = f"{user}:{week}"
+        self._index_generations[key] = self._index_generations.get(key, 0) + 1
+
     async def get_contributions_count(self, user: str, week: str) -> int:
         """Get the count of contributions for a specific user's week."""
         if self.contributions_index is None:
@@ -334,6 +374,7 @@ class MeilisearchService:
 
             # Wait for deletion to complete
             await asyncio.to_thread(self.client.wait_for_task, task.task_uid)
+            self._invalidate_search_cache(user, week)
 
             logger.info(
                 "Deleted contributions from Meilisearch",
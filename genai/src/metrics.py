@@ -78,6 +78,13 @@ class QuestionAnsweringMetrics:
         ["user", "week", "error_type"],
     )
 
+    tokens = Histogram(
+        "genai_question_answering_tokens_total",
+        "Number of tokens per model call while answering questions",
+        ["model", "type"],  # type is input/cached_input/output
+        buckets=TOKEN_BUCKETS,
+    )
+
 
 class SearchMetrics:
     """Metrics for search operations."""
@@ -190,6 +197,7 @@ question_answering_requests = QuestionAnsweringMetrics.requests
 question_answering_duration = QuestionAnsweringMetrics.duration
 question_confidence_score = QuestionAnsweringMetrics.confidence_score
 question_answering_errors = QuestionAnsweringMetrics.errors
+question_answering_tokens = QuestionAnsweringMetrics.tokens
 
 search_requests = SearchMetrics.requests
 search_duration = SearchMetrics.duration
@@ -232,7 +240,7 @@ class OperationTimer:
 
         @wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
                 OperationTimer._record_duration(metric, labels, start_time)
@@ -250,7 +258,7 @@ class OperationTimer:
 
         @wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
                 OperationTimer._record_duration(metric, labels, start_time)
@@ -265,7 +273,7 @@ class OperationTimer:
     @staticmethod
     def _record_duration(metric: Histogram, labels: dict[str, str] | None, start_time: float) -> None:
         """Record the operation duration in the metric."""
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         if labels:
             metric.labels(**labels).observe(duration)
         else:
@@ -274,7 +282,7 @@ class OperationTimer:
     @staticmethod
     def _log_operation_error(func: Callable, start_time: float, error: Exception) -> None:
         """Log operation failure with timing information."""
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         logger.error(
             "Operation failed",
             function=func.__name__,
@@ -530,6 +530,9 @@ class QuestionRequest(BaseModel):
 class QuestionEvidence(BaseModel):
     """Evidence supporting a question answer."""
 
+    # Shared between cached responses; immutable so no request can alter another's evidence
+    model_config = ConfigDict(frozen=True)
+
     title: str
     contribution_id: str
     contribution_type: ContributionType
@@ -541,6 +544,9 @@ class QuestionEvidence(BaseModel):
 class QuestionResponse(BaseModel):
     """Response to a question about a user's week."""
 
+    # Cached and re-stamped per request with model_copy; immutable so the cached copy stays intact
+    model_config = ConfigDict(frozen=True)
+
     question_id: str  # UUIDv7
     user: str
     week: str
@@ -556,6 +562,14 @@ class QuestionResponse(BaseModel):
     conversation_id: str | None = None
 
 
+class QuestionChunk(BaseModel):
+    """A chunk of the streaming question answering response."""
+
+    chunk_type: str  # "content" | "complete" | "error"
+    content: str
+    response: QuestionResponse | None = None  # Set on the "complete" chunk
+
+
 class SummaryRequest(BaseModel):
     """Request to generate a summary for a user's week."""
 
@@ -567,15 +581,6 @@ class SummaryRequest(BaseModel):
     max_detail_level: DetailLevel = DetailLevel.COMPREHENSIVE
 
 
-class SummaryChunk(BaseModel):
-    """A chunk of the streaming summary response."""
-
-    chunk_type: str  # "section" | "content" | "metadata" | "complete" | "error"
-    section: str | None = None  # "overview" | "commits" | "pull_requests" | "issues" | "releases" | "analysis"
-    content: str
-    metadata: dict[str, Any] | None = None
-
-
 class SummaryMetadata(BaseModel):
     """Metadata about a generated summary."""
 
@@ -607,6 +612,16 @@ class SummaryResponse(BaseModel):
     generated_at: datetime
 
 
+class SummaryChunk(BaseModel):
+    """A chunk of the streaming summary response."""
+
+    chunk_type: str  # "section" | "content" | "metadata" | "complete" | "error"
+    section: str | None = None  # "overview" | "commits" | "pull_requests" | "issues" | "releases" | "analysis"
+    content: str
+    metadata: dict[str, Any] | None = None
+    summary: SummaryResponse | None = None  # Set on the "complete" chunk
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
 
@@ -1,19 +1,23 @@
 """Summary service for generating weekly progress reports."""
 
+import asyncio
+import heapq
+import os
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, cast
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, cast
 
 import structlog
 from langchain.prompts import ChatPromptTemplate
-
-# LangChain imports
-from langchain.schema import HumanMessage, SystemMessage
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.prebuilt import create_react_agent
+from langchain_core.messages.ai import add_ai_message_chunks
+from langchain_core.utils.json import parse_partial_json
 from pydantic import BaseModel as PydanticBaseModel
-from pydantic import Field
+from pydantic import Field, ValidationError
 
 from .agent_tools import all_tools, get_tool_descriptions
+from .llm_cache import LLMCache, make_cache_key
 from .llm_service import LLMService
 from .metrics import (
     record_request_metrics,
@@ -22,22 +26,143 @@ from .metrics import (
     time_operation,
 )
 from .models import (
-    CommitContribution,
+    ContributionType,
     GitHubContribution,
-    IssueContribution,
-    PullRequestContribution,
-    ReleaseContribution,
+    SummaryChunk,
     SummaryMetadata,
     SummaryResponse,
     generate_uuidv7,
 )
+from .text_utils import normalize_text
 
-# Type-only import to avoid circular dependency
+# Type-only imports; the ingest one avoids a circular dependency
 if TYPE_CHECKING:
+    from langchain_core.messages import AIMessageChunk
+    from langchain_core.runnables import RunnableSequence
+
     from .ingest import ContributionsIngestionService
 
 logger = structlog.get_logger()
 
+# Routes progress report requests to the same provider-side prompt cache
+SUMMARY_PROMPT_CACHE_KEY = "promptheus-summary"
+
+# Reports are cached across service instances; re-summarizing unchanged contributions skips the LLM
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "256"))
+SUMMARY_CACHE_TTL_SECONDS = int(os.getenv("SUMMARY_CACHE_TTL_SECONDS", "86400"))
+report_cache = LLMCache("summary", SUMMARY_CACHE_MAX_ENTRIES, SUMMARY_CACHE_TTL_SECONDS)
+
+# Streamed output is parsed once per this many chunks, not per token (re-parsing the whole JSON each time)
+SUMMARY_STREAM_PARSE_INTERVAL = 32
+
+# Finish reasons of output the model ended itself; anything else (e.g. "length") means it was cut off
+COMPLETE_FINISH_REASONS = frozenset({"stop", "tool_calls"})
+
+# Prompt line for each contribution type
+PROMPT_FORMATTERS: dict[ContributionType, Callable[[Any], str]] = {
+    ContributionType.COMMIT: lambda c: f"COMMIT in {c.repository}: {c.message}",
+    ContributionType.PULL_REQUEST: lambda c: f"PULL REQUEST in {c.repository}: {c.title} ({c.state})",
+    ContributionType.ISSUE: lambda c: f"ISSUE in {c.repository}: {c.title} ({c.state})",
+    ContributionType.RELEASE: lambda c: f"RELEASE in {c.repository}: {c.name} ({c.tag_name})",
+}
+
+# Contributions of each type listed in the report prompt, to bound its tokens; the largest are kept
+PROMPT_CONTRIBUTION_LIMITS = {
+    ContributionType.COMMIT: 10,
+    ContributionType.PULL_REQUEST: 15,
+    ContributionType.ISSUE: 15,
+    ContributionType.RELEASE: 10,
+}
+
+# Size of a contribution, used to pick which ones are listed when a type exceeds its limit
+CONTRIBUTION_WEIGHTS: dict[ContributionType, Callable[[Any], int]] = {
+    ContributionType.COMMIT: lambda c: c.stats.total,
+    ContributionType.PULL_REQUEST: lambda c: c.additions + c.deletions,
+    ContributionType.ISSUE: lambda c: c.comments,
+    ContributionType.RELEASE: lambda c: len(c.body or ""),
+}
+
+# Critical analysis reported for a week without contributions
+EMPTY_WEEK_ANALYSIS = (
+    "No contributions detected for {user} during week {week}. "
+    "This absence of activity requires immediate attention:\n\n"
+    "CRITICAL OBSERVATIONS:\n"
+    "• Zero commits, PRs, or issues indicates complete disengagement from development work\n"
+    "• This could signal: blocked work, unclear assignments, personal issues, or role misalignment\n"
+    "• Extended periods without contributions impact team velocity and project timelines\n\n"
+    "RECOMMENDED MANAGER ACTIONS:\n"
+    "1. Schedule immediate 1:1 to understand blockers or challenges\n"
+    "2. Review current task assignments and priorities\n"
+    "3. Assess if developer has necessary resources and support\n"
+    "4. Consider pairing opportunities to re-engage with codebase\n\n"
+    "Note: Verify if work is happening outside tracked repositories before drawing conclusions."
+)
+
+# Built once at import. The system message is identical for every report so the provider can cache it as a
+# prompt prefix; the user, week and contributions only appear in the human message.
+PROGRESS_REPORT_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            """You are Auto-Pulse, a senior engineering manager assistant that generates weekly progress
+reports with critical analysis for developer performance reviews and career development.
+
+Auto-Pulse provides direct, evidence-based feedback without unnecessary pleasantries or flattery.
+
+You have access to the following tools:
+{tool_descriptions}
+
+Your role is to analyze the developer's work and provide:
+1. Factual summary of accomplishments
+2. Critical analysis of software engineering practices
+3. Actionable feedback for improvement
+
+CRITICAL ANALYSIS GUIDELINES:
+- Be direct and honest - managers need truthful assessments for effective 1:1s
+- Base ALL observations on concrete evidence from contributions
+- Identify both strengths and areas needing improvement
+- Focus on patterns that impact code quality, collaboration, and productivity
+- Suggest specific improvements tied to career progression
+
+ANALYZE THESE SE BEST PRACTICES:
+1. Code Quality & Standards
+   - Commit message quality (descriptive, atomic, follows conventions)
+   - PR size and scope (small, focused changes vs large, unfocused ones)
+   - Testing evidence (are tests mentioned in commits/PRs?)
+
+2. Collaboration & Communication
+   - PR descriptions quality
+   - Issue tracking discipline
+   - Response to feedback (PR review cycles)
+
+3. Development Practices
+   - Frequency and consistency of contributions
+   - Balance between feature work, bug fixes, and maintenance
+   - Documentation habits
+
+4. Technical Leadership
+   - Mentoring indicators (reviewing others' PRs, helping with issues)
+   - Architectural decisions and design discussions
+   - Initiative in addressing technical debt
+
+Use the available tools to gather additional context when needed for accurate analysis.
+
+IMPORTANT: The 'analysis' field must contain a critical, evidence-based assessment of the developer's
+software engineering practices this week. Include specific examples and actionable feedback.""",
+        ),
+        (
+            "human",
+            """Analyze {user}'s contributions for week {week}:
+
+{contributions_summary}
+
+Generate a comprehensive progress report with critical analysis.
+Focus on factual observations and specific examples from the contributions.
+Use tools when needed to verify facts or gather additional context.""",
+        ),
+    ]
+).partial(tool_descriptions=get_tool_descriptions(all_tools))
+
 
 class WeeklyProgressOutput(PydanticBaseModel):
     """Structured output for weekly progress report."""
@@ -52,23 +177,31 @@ class WeeklyProgressOutput(PydanticBaseModel):
 class SummaryService:
     """Service for generating weekly progress reports."""
 
-    def __init__(self, ingestion_service: "ContributionsIngestionService") -> None:
+    def __init__(self, ingestion_service: "ContributionsIngestionService", cache: LLMCache | None = None) -> None:
         """Initialize the summary service.
 
         Args:
             ingestion_service: Service for ingesting and retrieving contributions.
+            cache: Report cache; defaults to the module-level cache shared by all instances.
         """
         self.ingestion_service = ingestion_service
+        self.cache = cache if cache is not None else report_cache
 
-        # Initialize LLM using centralized service
-        self.llm = LLMService.create_llm(
+        # Process-wide LLM instance, so every summary shares its HTTP client and connection pool
+        self.llm = LLMService.get_shared_llm(
             temperature=0.2,
             max_tokens=2500,
             timeout=120.0,  # Increased timeout
+            prompt_cache_key=SUMMARY_PROMPT_CACHE_KEY,
         )
 
-        # Create LangGraph agent for tool-enhanced summary generation
-        self.agent = create_react_agent(model=self.llm, tools=all_tools, checkpointer=MemorySaver())
+        # Bind the Pydantic model to the LLM for structured output
+        structured_llm = cast("RunnableSequence", self.llm.with_structured_output(WeeklyProgressOutput))
+        self.progress_report_chain = PROGRESS_REPORT_PROMPT | structured_llm
+        # Streaming runs the model and its output parser separately, to parse partial output only now and then
+        # and to check the finished output was not cut off
+        self.progress_report_model = PROGRESS_REPORT_PROMPT | structured_llm.first
+        self.progress_report_parser = structured_llm.last
 
     @time_operation(summary_generation_duration, {"repository": "unknown", "username": "unknown"})
     async def generate_summary(
@@ -78,16 +211,19 @@ class SummaryService:
         summary_id: str | None = None,
     ) -> SummaryResponse:
         """Generate a weekly progress report."""
-        datetime.now(UTC)
         if summary_id is None:
             summary_id = generate_uuidv7()
 
+        # Get all contributions for the user's week; an empty week needs no LLM call or request metrics
+        contributions = self.ingestion_service.get_user_week_contributions(user, week)
+
+        if not contributions:
+            logger.warning("No contributions found for summary", user=user, week=week)
+            return self._create_empty_summary(summary_id, user, week)
+
+        metric_labels = {"repository": "unknown", "username": user}
         try:
-            record_request_metrics(
-                summary_generation_requests,
-                {"repository": "unknown", "username": user, "status": "started"},
-                "started",
-            )
+            record_request_metrics(summary_generation_requests, metric_labels, "started")
 
             logger.info(
                 "Starting weekly progress report generation",
@@ -96,49 +232,17 @@ class SummaryService:
                 summary_id=summary_id,
             )
 
-            # Get all contributions for the user's week
-            contributions = self.ingestion_service.get_user_week_contributions(user, week)
-
-            if not contributions:
-                logger.warning("No contributions found for summary", user=user, week=week)
-                return self._create_empty_summary(summary_id, user, week)
+            # Format the prompt and collect metadata in one pass
+            contributions_summary, metadata = self._scan_contributions(contributions, week)
 
             # Generate the progress report using AI
-            progress_report = await self._generate_progress_report(user, week, contributions)
-
-            # Generate metadata
-            metadata = self._generate_metadata(contributions, week)
-
-            # Create final summary response
-            summary = SummaryResponse(
-                summary_id=summary_id,
-                user=user,
-                week=week,
-                overview=progress_report.summary,
-                commits_summary=f"Completed {metadata.commits_count} commits"
-                if metadata.commits_count > 0
-                else "No commits this week",
-                pull_requests_summary=f"Worked on {metadata.pull_requests_count} pull requests"
-                if metadata.pull_requests_count > 0
-                else "No pull requests this week",
-                issues_summary=f"Addressed {metadata.issues_count} issues"
-                if metadata.issues_count > 0
-                else "No issues this week",
-                releases_summary=f"Published {metadata.releases_count} releases"
-                if metadata.releases_count > 0
-                else "No releases this week",
-                analysis=progress_report.analysis,  # Use the critical analysis from the AI
-                key_achievements=progress_report.key_accomplishments,
-                areas_for_improvement=progress_report.impediments + progress_report.next_steps,
-                metadata=metadata,
-                generated_at=datetime.now(UTC),
+            progress_report = await self._generate_progress_report(
+                user, week, contributions_summary, len(contributions)
             )
 
-            record_request_metrics(
-                summary_generation_requests,
-                {"repository": "unknown", "username": user},
-                "success",
-            )
+            summary = self._create_summary(summary_id, user, week, progress_report, metadata)
+
+            record_request_metrics(summary_generation_requests, metric_labels, "success")
 
             logger.info(
                 "Weekly progress report generation completed",
@@ -151,11 +255,7 @@ class SummaryService:
             return summary
 
         except Exception as e:
-            record_request_metrics(
-                summary_generation_requests,
-                {"repository": "unknown", "username": user},
-                "error",
-            )
+            record_request_metrics(summary_generation_requests, metric_labels, "error")
 
             logger.exception(
                 "Weekly progress report generation failed",
@@ -165,153 +265,315 @@ class SummaryService:
             )
             raise
 
-    async def _generate_progress_report(
-        self,
-        user: str,
-        week: str,
-        contributions: list[GitHubContribution],
-    ) -> WeeklyProgressOutput:
-        """Generate structured progress report using AI."""
-        contributions_summary = self._format_contributions_for_prompt(contributions)
-        tool_descriptions = get_tool_descriptions(all_tools)
-
-        # Bind the Pydantic model to the LLM for structured output
-        structured_llm = self.llm.with_structured_output(WeeklyProgressOutput)
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                SystemMessage(
-                    content=f"""You are Auto-Pulse, a senior engineering manager assistant that generates weekly progress
-reports with critical analysis for developer performance reviews and career development.
-
-Auto-Pulse provides direct, evidence-based feedback without unnecessary pleasantries or flattery.
-
-You have access to the following tools:
-{tool_descriptions}
-
-Your role is to analyze developer \"{user}\"\'s work and provide:
-1. Factual summary of accomplishments
-2. Critical analysis of software engineering practices
-3. Actionable feedback for improvement
+    async def generate_summary_stream(self, user: str, week: str) -> AsyncIterator[SummaryChunk]:
+        """Generate a weekly progress report, yielding the analysis as the LLM writes it.
 
-CRITICAL ANALYSIS GUIDELINES:
-- Be direct and honest - managers need truthful assessments for effective 1:1s
-- Base ALL observations on concrete evidence from contributions
-- Identify both strengths and areas needing improvement
-- Focus on patterns that impact code quality, collaboration, and productivity
-- Suggest specific improvements tied to career progression
+        Yields a ``metadata`` chunk before the LLM is called, ``section`` chunks with the overview and
+        the analysis so far once the report has started, ``content`` chunks with further analysis text
+        (line by line), then a single ``complete`` chunk carrying the full summary.
+        """
+        summary_id = generate_uuidv7()
+        contributions = self.ingestion_service.get_user_week_contributions(user, week)
 
-ANALYZE THESE SE BEST PRACTICES:
-1. Code Quality & Standards
-   - Commit message quality (descriptive, atomic, follows conventions)
-   - PR size and scope (small, focused changes vs large, unfocused ones)
-   - Testing evidence (are tests mentioned in commits/PRs?)
+        if not contributions:
+            logger.warning("No contributions found for summary", user=user, week=week)
+            summary = self._create_empty_summary(summary_id, user, week)
+            yield SummaryChunk(chunk_type="complete", content=summary.overview, summary=summary)
+            return
 
-2. Collaboration & Communication
-   - PR descriptions quality
-   - Issue tracking discipline
-   - Response to feedback (PR review cycles)
+        metric_labels = {"repository": "unknown", "username": user}
+        try:
+            record_request_metrics(summary_generation_requests, metric_labels, "started")
 
-3. Development Practices
-   - Frequency and consistency of contributions
-   - Balance between feature work, bug fixes, and maintenance
-   - Documentation habits
+            contributions_summary, metadata = self._scan_contributions(contributions, week)
+            yield SummaryChunk(
+                chunk_type="metadata",
+                content=f"{metadata.total_contributions} contributions",
+                metadata=metadata.model_dump(mode="json"),
+            )
 
-4. Technical Leadership
-   - Mentoring indicators (reviewing others' PRs, helping with issues)
-   - Architectural decisions and design discussions
-   - Initiative in addressing technical debt
+            progress_report: WeeklyProgressOutput | None = None
+            streamed_analysis: str | None = None
+            async for progress_report in self._stream_progress_report(
+                user, week, contributions_summary, len(contributions)
+            ):
+                analysis = progress_report.analysis
+                # Analysis text is sent in whole lines so clients do not get an event per token
+                lines_end = analysis.rfind("\n") + 1
+                if streamed_analysis is None or not analysis.startswith(streamed_analysis):
+                    # First report, or a fallback replacing a partial one: resend both sections
+                    yield SummaryChunk(chunk_type="section", section="overview", content=progress_report.summary)
+                    yield SummaryChunk(chunk_type="section", section="analysis", content=analysis[:lines_end])
+                    streamed_analysis = analysis[:lines_end]
+                elif lines_end > len(streamed_analysis):
+                    yield SummaryChunk(
+                        chunk_type="content", section="analysis", content=analysis[len(streamed_analysis) : lines_end]
+                    )
+                    streamed_analysis = analysis[:lines_end]
+
+            # Flush the last, unterminated line of the complete report
+            progress_report = cast("WeeklyProgressOutput", progress_report)
+            if streamed_analysis is not None and len(progress_report.analysis) > len(streamed_analysis):
+                yield SummaryChunk(
+                    chunk_type="content", section="analysis", content=progress_report.analysis[len(streamed_analysis) :]
+                )
+
+            summary = self._create_summary(summary_id, user, week, progress_report, metadata)
+            record_request_metrics(summary_generation_requests, metric_labels, "success")
+            yield SummaryChunk(chunk_type="complete", content=summary.overview, summary=summary)
 
-Use the available tools to gather additional context when needed for accurate analysis.
+        except Exception as e:
+            record_request_metrics(summary_generation_requests, metric_labels, "error")
+            logger.exception("Streaming weekly progress report generation failed", user=user, week=week, error=str(e))
+            raise
 
-IMPORTANT: The 'analysis' field must contain a critical, evidence-based assessment of the developer's
-software engineering practices this week. Include specific examples and actionable feedback."""
-                ),
-                HumanMessage(
-                    content=f"""Analyze {user}'s contributions for week {week}:
+    async def _generate_progress_report(
+        self,
+        user: str,
+        week: str,
+        contributions_summary: str,
+        contributions_count: int,
+    ) -> WeeklyProgressOutput:
+        """Generate structured progress report using AI."""
+        cache_key = self._progress_report_cache_key(user, week, contributions_summary)
+        cached_report: WeeklyProgressOutput | None = await self.cache.get(cache_key)
+        if cached_report is not None:
+            logger.info("Using cached progress report", user=user, week=week)
+            return cached_report
 
-{contributions_summary}
+        try:
+            # Invoke the chain and get the structured response
+            async with LLMService.concurrency_limit():
+                report = cast(
+                    "WeeklyProgressOutput",
+                    await self.progress_report_chain.ainvoke(
+                        {
+                            "user": user,
+                            "week": week,
+                            "contributions_summary": contributions_summary,
+                        }
+                    ),
+                )
+        except Exception as e:
+            logger.warning(
+                "Failed to generate structured progress report, using fallback",
+                error=str(e),
+            )
+            return self._fallback_progress_report(user, contributions_count)
 
-Generate a comprehensive progress report with critical analysis.
-Focus on factual observations and specific examples from the contributions.
-Use tools when needed to verify facts or gather additional context."""
-                ),
-            ]
-        )
+        # Fallback reports are not cached so the next request retries the LLM
+        await self.cache.set(cache_key, report)
+        return report
 
-        # Create the chain with structured output
-        chain = prompt | structured_llm
+    async def _stream_progress_report(
+        self,
+        user: str,
+        week: str,
+        contributions_summary: str,
+        contributions_count: int,
+    ) -> AsyncIterator[WeeklyProgressOutput]:
+        """Stream the structured progress report as the LLM generates it.
+
+        Partial reports are yielded once every field has started; the analysis, written last, keeps growing
+        in later reports. The final report is the complete one, and is only cached if the model finished its
+        output and the output parses. Output cut off at the token limit is replaced by the fallback report.
+        Cached and fallback reports are yielded once.
+        """
+        cache_key = self._progress_report_cache_key(user, week, contributions_summary)
+        cached_report: WeeklyProgressOutput | None = await self.cache.get(cache_key)
+        if cached_report is not None:
+            logger.info("Using cached progress report", user=user, week=week)
+            yield cached_report
+            return
 
         try:
-            # Invoke the chain and get the structured response
-            return cast("WeeklyProgressOutput", await chain.ainvoke({}))
+            chunks: list[AIMessageChunk] = []
+            # Structured output arrives as message text or as tool call arguments, depending on the provider
+            output_parts: list[str] = []
+            # The model is read by a separate task, so a slow or gone consumer does not hold its LLM slot
+            queue: asyncio.Queue[AIMessageChunk | None] = asyncio.Queue()
+            reader = asyncio.create_task(
+                self._read_progress_report_output(
+                    {
+                        "user": user,
+                        "week": week,
+                        "contributions_summary": contributions_summary,
+                    },
+                    queue,
+                )
+            )
+            try:
+                while (chunk := await queue.get()) is not None:
+                    chunks.append(chunk)
+                    output_parts.append(chunk.text())
+                    output_parts.extend(tool_call_chunk["args"] or "" for tool_call_chunk in chunk.tool_call_chunks)
+                    if len(chunks) % SUMMARY_STREAM_PARSE_INTERVAL == 0:
+                        partial_report = self._parse_partial_progress_report("".join(output_parts))
+                        if partial_report is not None:
+                            yield partial_report
+                # Re-raises the model's error, if any
+                await reader
+            finally:
+                reader.cancel()
+
+            message = add_ai_message_chunks(chunks[0], *chunks[1:])
+            finish_reason = message.response_metadata.get("finish_reason") or message.response_metadata.get(
+                "done_reason"
+            )
+            if finish_reason not in COMPLETE_FINISH_REASONS:
+                msg = f"Progress report output did not finish (finish reason: {finish_reason})"
+                raise ValueError(msg)
+            report = cast("WeeklyProgressOutput | None", await self.progress_report_parser.ainvoke(message))
+            if report is None:
+                msg = "Progress report output contains no report"
+                raise ValueError(msg)
         except Exception as e:
             logger.warning(
                 "Failed to generate structured progress report, using fallback",
                 error=str(e),
             )
-            # Fallback with basic analysis
-            return WeeklyProgressOutput(
-                summary=f"{user} completed {len(contributions)} contributions this week across various repositories.",
-                key_accomplishments=[f"Completed {len(contributions)} development tasks"],
-                impediments=[],
-                next_steps=["Continue with assigned development tasks"],
-                analysis="Unable to generate a critical analysis of the developer's work this week.",
-            )
+            # Not cached so the next request retries the LLM
+            yield self._fallback_progress_report(user, contributions_count)
+            return
+
+        await self.cache.set(cache_key, report)
+        yield report
+
+    async def _read_progress_report_output(
+        self, inputs: dict[str, str], queue: "asyncio.Queue[AIMessageChunk | None]"
+    ) -> None:
+        """Stream the model's report output into ``queue``, ending with ``None``; holds the LLM slot meanwhile."""
+        try:
+            async with LLMService.concurrency_limit():
+                async for chunk in self.progress_report_model.astream(inputs):
+                    queue.put_nowait(chunk)
+        finally:
+            queue.put_nowait(None)
+
+    def _progress_report_cache_key(self, user: str, week: str, contributions_summary: str) -> str:
+        """Build the progress report cache key from the prompt's contributions summary."""
+        # The prompt only sees the formatted summary. Summaries listing the same contributions in another order
+        # or differing only in case and punctuation would get an equivalent report, so they share a key.
+        return make_cache_key(
+            user=user,
+            week=week,
+            contributions=sorted(normalize_text(line) for line in contributions_summary.splitlines()),
+            model=LLMService.get_current_model_name(),
+        )
+
+    def _parse_partial_progress_report(self, output: str) -> WeeklyProgressOutput | None:
+        """Parse unfinished JSON output as a report, or return ``None`` until every field has started."""
+        try:
+            return WeeklyProgressOutput.model_validate(parse_partial_json(output))
+        except ValidationError:
+            return None
+
+    def _fallback_progress_report(self, user: str, contributions_count: int) -> WeeklyProgressOutput:
+        """Create the basic report used when the LLM fails."""
+        return WeeklyProgressOutput(
+            summary=f"{user} completed {contributions_count} contributions this week across various repositories.",
+            key_accomplishments=[f"Completed {contributions_count} development tasks"],
+            impediments=[],
+            next_steps=["Continue with assigned development tasks"],
+            analysis="Unable to generate a critical analysis of the developer's work this week.",
+        )
 
-    def _format_contributions_for_prompt(self, contributions: list[GitHubContribution]) -> str:
-        """Format contributions for AI prompt."""
-        formatted = []
-        for contrib in contributions:
-            if isinstance(contrib, CommitContribution):
-                formatted.append(f"COMMIT in {contrib.repository}: {contrib.message}")
-            elif isinstance(contrib, PullRequestContribution):
-                formatted.append(f"PULL REQUEST in {contrib.repository}: {contrib.title} ({contrib.state})")
-            elif isinstance(contrib, IssueContribution):
-                formatted.append(f"ISSUE in {contrib.repository}: {contrib.title} ({contrib.state})")
-            elif isinstance(contrib, ReleaseContribution):
-                formatted.append(f"RELEASE in {contrib.repository}: {contrib.name} ({contrib.tag_name})")
-
-        return "\n".join(formatted) if formatted else "No detailed contribution data available."
-
-    def _generate_metadata(
+    def _create_summary(
+        self,
+        summary_id: str,
+        user: str,
+        week: str,
+        progress_report: WeeklyProgressOutput,
+        metadata: SummaryMetadata,
+    ) -> SummaryResponse:
+        """Create the summary response from the AI progress report and the contribution metadata."""
+        # Every field comes from validated models or values built here, so skip re-validation
+        return SummaryResponse.model_construct(
+            summary_id=summary_id,
+            user=user,
+            week=week,
+            overview=progress_report.summary,
+            commits_summary=f"Completed {metadata.commits_count} commits"
+            if metadata.commits_count > 0
+            else "No commits this week",
+            pull_requests_summary=f"Worked on {metadata.pull_requests_count} pull requests"
+            if metadata.pull_requests_count > 0
+            else "No pull requests this week",
+            issues_summary=f"Addressed {metadata.issues_count} issues"
+            if metadata.issues_count > 0
+            else "No issues this week",
+            releases_summary=f"Published {metadata.releases_count} releases"
+            if metadata.releases_count > 0
+            else "No releases this week",
+            analysis=progress_report.analysis,  # Use the critical analysis from the AI
+            key_achievements=progress_report.key_accomplishments,
+            areas_for_improvement=progress_report.impediments + progress_report.next_steps,
+            metadata=metadata,
+            generated_at=metadata.generated_at,
+        )
+
+    def _scan_contributions(
         self,
         contributions: list[GitHubContribution],
         week: str,
-    ) -> SummaryMetadata:
-        """Generate metadata about the contributions."""
-        commits_count = 0
-        pull_requests_count = 0
-        issues_count = 0
-        releases_count = 0
-        repositories = set()
-
-        for contrib in contributions:
-            repositories.add(contrib.repository)
-
-            if isinstance(contrib, CommitContribution):
-                commits_count += 1
-            elif isinstance(contrib, PullRequestContribution):
-                pull_requests_count += 1
-            elif isinstance(contrib, IssueContribution):
-                issues_count += 1
-            elif isinstance(contrib, ReleaseContribution):
-                releases_count += 1
-
-        return SummaryMetadata(
+    ) -> tuple[str, SummaryMetadata]:
+        """Format contributions for the AI prompt and collect their metadata.
+
+        Returns:
+            The prompt text and the summary metadata.
+        """
+        # Counting and collecting through map keeps those iterations in C
+        type_counts = Counter(map(attrgetter("type"), contributions))
+        repositories = set(map(attrgetter("repository"), contributions))
+
+        formatted = [
+            PROMPT_FORMATTERS[contrib.type](contrib)
+            for contrib in self._select_prompt_contributions(contributions, type_counts)
+        ]
+        for contribution_type, count in type_counts.items():
+            omitted = count - PROMPT_CONTRIBUTION_LIMITS[contribution_type]
+            if omitted > 0:
+                formatted.append(f"(and {omitted} smaller {contribution_type.value.replace('_', ' ')}s not listed)")
+
+        contributions_summary = "\n".join(formatted) or "No detailed contribution data available."
+        return contributions_summary, SummaryMetadata.model_construct(
             total_contributions=len(contributions),
-            commits_count=commits_count,
-            pull_requests_count=pull_requests_count,
-            issues_count=issues_count,
-            releases_count=releases_count,
+            commits_count=type_counts[ContributionType.COMMIT],
+            pull_requests_count=type_counts[ContributionType.PULL_REQUEST],
+            issues_count=type_counts[ContributionType.ISSUE],
+            releases_count=type_counts[ContributionType.RELEASE],
             repositories=list(repositories),
             time_period=week,
             generated_at=datetime.now(UTC),
         )
 
+    def _select_prompt_contributions(
+        self,
+        contributions: list[GitHubContribution],
+        type_counts: Counter[ContributionType],
+    ) -> list[GitHubContribution]:
+        """Keep the largest contributions of each type that exceeds its prompt limit, in their original order."""
+        over_limit = [
+            contribution_type
+            for contribution_type, count in type_counts.items()
+            if count > PROMPT_CONTRIBUTION_LIMITS[contribution_type]
+        ]
+        if not over_limit:
+            return contributions
+
+        kept: set[int] = set()
+        for contribution_type in over_limit:
+            candidates = [contrib for contrib in contributions if contrib.type == contribution_type]
+            largest = heapq.nlargest(
+                PROMPT_CONTRIBUTION_LIMITS[contribution_type], candidates, key=CONTRIBUTION_WEIGHTS[contribution_type]
+            )
+            kept.update(map(id, largest))
+        return [contrib for contrib in contributions if contrib.type not in over_limit or id(contrib) in kept]
+
     def _create_empty_summary(self, summary_id: str, user: str, week: str) -> SummaryResponse:
         """Create summary when no contributions are found."""
-        metadata = SummaryMetadata(
+        generated_at = datetime.now(UTC)
+        metadata = SummaryMetadata.model_construct(
             total_contributions=0,
             commits_count=0,
             pull_requests_count=0,
@@ -319,26 +581,13 @@ Use tools when needed to verify facts or gather additional context."""
             releases_count=0,
             repositories=[],
             time_period=week,
-            generated_at=datetime.now(UTC),
+            generated_at=generated_at,
         )
 
         # Provide critical analysis even for zero contributions
-        analysis = (
-            f"No contributions detected for {user} during week {week}. "
-            "This absence of activity requires immediate attention:\n\n"
-            "CRITICAL OBSERVATIONS:\n"
-            "• Zero commits, PRs, or issues indicates complete disengagement from development work\n"
-            "• This could signal: blocked work, unclear assignments, personal issues, or role misalignment\n"
-            "• Extended periods without contributions impact team velocity and project timelines\n\n"
-            "RECOMMENDED MANAGER ACTIONS:\n"
-            "1. Schedule immediate 1:1 to understand blockers or challenges\n"
-            "2. Review current task assignments and priorities\n"
-            "3. Assess if developer has necessary resources and support\n"
-            "4. Consider pairing opportunities to re-engage with codebase\n\n"
-            "Note: Verify if work is happening outside tracked repositories before drawing conclusions."
-        )
+        analysis = EMPTY_WEEK_ANALYSIS.format(user=user, week=week)
 
-        return SummaryResponse(
+        return SummaryResponse.model_construct(
             summary_id=summary_id,
             user=user,
             week=week,
@@ -351,5 +600,5 @@ Use tools when needed to verify facts or gather additional context."""
             key_achievements=[],
             areas_for_improvement=["Immediate re-engagement with development work required"],
             metadata=metadata,
-            generated_at=datetime.now(UTC),
+            generated_at=generated_at,
         )
@@ -0,0 +1,23 @@
+"""Text helpers shared by cache keys, keyword matching and token budgeting."""
+
+import re
+
+# Sentence punctuation that does not change what is being asked; mapped to spaces
+_IGNORED_PUNCTUATION = str.maketrans("?!.,;:\"'()", " " * 10)
+
+# Runs of letters, digits and underscores; punctuation and symbols separate words
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize free text for use in cache keys.
+
+    Case, sentence punctuation and whitespace are ignored, so "What was done?" and
+    "what was done" map to the same key.
+    """
+    return " ".join(text.translate(_IGNORED_PUNCTUATION).lower().split())
+
+
+def tokenize_words(text: str) -> list[str]:
+    """Split free text into lowercased words for keyword matching, e.g. "Fixed bug." -> ["fixed", "bug"]."""
+    return _WORD_PATTERN.findall(text.lower())
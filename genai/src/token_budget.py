@@ -0,0 +1,121 @@
+"""Token counting and budgeting for prompt content."""
+
+from functools import lru_cache
+
+import structlog
+import tiktoken
+
+from .text_utils import tokenize_words
+
+logger = structlog.get_logger()
+
+# Encoding used for models tiktoken does not know (e.g. Ollama models); close enough for budgeting
+FALLBACK_ENCODING = "cl100k_base"
+
+# Rough ratio used when no encoding can be loaded (e.g. offline without a tiktoken cache)
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=8)
+def _load_encoding(model_name: str) -> tiktoken.Encoding:
+    """Load the tiktoken encoding for a model; raises if it is neither cached nor downloadable."""
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding(FALLBACK_ENCODING)
+
+
+def get_encoding(model_name: str) -> tiktoken.Encoding | None:
+    """Get the tiktoken encoding for a model, or ``None`` if none can be loaded.
+
+    Failures are not memoized, so a later call retries the load. The Docker image prefetches
+    the encodings into ``TIKTOKEN_CACHE_DIR`` so requests never wait on a download.
+    """
+    try:
+        return _load_encoding(model_name)
+    except Exception as e:
+        logger.warning(
+            "Failed to load tiktoken encoding, estimating tokens from length", model=model_name, error=str(e)
+        )
+        return None
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model_name: str) -> str:
+    """Truncate text to at most ``max_tokens`` tokens for the given model."""
+    encoding = get_encoding(model_name)
+    if encoding is None:
+        return text[: max_tokens * CHARS_PER_TOKEN]
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def count_tokens(text: str, model_name: str) -> int:
+    """Count the tokens in text for the given model."""
+    encoding = get_encoding(model_name)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_tokens_batch(texts: list[str], model_name: str) -> list[int]:
+    """Count the tokens of several texts with a single (multi-threaded) tokenizer call."""
+    encoding = get_encoding(model_name)
+    if encoding is None:
+        return [-(-len(text) // CHARS_PER_TOKEN) for text in texts]
+    return [len(tokens) for tokens in encoding.encode_batch(texts, disallowed_special=())]
+
+
+def select_relevant_lines(text: str, query_words: frozenset[str], max_tokens: int, model_name: str) -> str:
+    """Fit text into a token budget, keeping the lines that share the most words with the query.
+
+    ``query_words`` is the query split with ``tokenize_words``, so it can be computed once for many texts.
+
+    The first line (the contribution header) is ranked first and kept lines stay in their original
+    order. Falls back to plain truncation when no other line mentions a query word.
+    """
+    if count_tokens(text, model_name) <= max_tokens:
+        return text
+
+    lines = text.splitlines()
+    scores = [len(query_words.intersection(tokenize_words(line))) for line in lines]
+    if not any(scores[1:]):
+        return truncate_to_tokens(text, max_tokens, model_name)
+
+    # Header first, then by descending overlap; the sort is stable so earlier lines win ties
+    ranked = [0, *sorted(range(1, len(lines)), key=lambda i: -scores[i])]
+    selected = []
+    used = 0
+    for i in ranked:
+        cost = count_tokens(lines[i], model_name) + 1  # + newline
+        if used + cost <= max_tokens:
+            selected.append(i)
+            used += cost
+
+    if not selected:
+        return truncate_to_tokens(text, max_tokens, model_name)
+    return "\n".join(lines[i] for i in sorted(selected))
+
+
+def allocate_token_budget(weights: list[float], total_tokens: int, min_tokens: int = 0) -> list[int]:
+    """Split a token budget across items proportionally to their weights.
+
+    Args:
+        weights: Non-negative weight per item (e.g. relevance scores)
+        total_tokens: Total tokens to distribute
+        min_tokens: Tokens every item gets regardless of its weight; only the rest is split by weight
+
+    Returns:
+        Token budget per item, in the same order as ``weights``
+    """
+    if not weights:
+        return []
+
+    remaining = max(total_tokens - min_tokens * len(weights), 0)
+    weight_sum = sum(weights)
+    if weight_sum <= 0:
+        return [min_tokens + remaining // len(weights)] * len(weights)
+
+    return [min_tokens + int(remaining * weight / weight_sum) for weight in weights]
@@ -130,7 +130,9 @@ def test_services(meilisearch_service):
     """Initialize test services with real Meilisearch."""
     ingestion_service = ContributionsIngestionService(meilisearch_service)
     github_content_service = GitHubContentService()
-    qa_service = QuestionAnsweringService(github_content_service, meilisearch_service)
+    qa_service = QuestionAnsweringService(
+        github_content_service, meilisearch_service, ingestion_service=ingestion_service
+    )
     summary_service = SummaryService(ingestion_service)
 
     # Link summary service to ingestion service (required for unified workflow)
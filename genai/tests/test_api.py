@@ -1,5 +1,6 @@
 """Tests for the FastAPI application endpoints."""
 
+import json
 import time
 
 import pytest
@@ -365,6 +366,26 @@ class TestQuestionAnswering:
         assert isinstance(data["response_time_ms"], int)
         assert data["conversation_id"] == "testuser:2024-W21"
 
+    async def test_ask_question_stream(self, test_client) -> None:
+        """Test that the streaming endpoint emits content and ends with the full response."""
+        request_data = {
+            "question": "Which bugs were fixed?",
+            "repository": "octocat/Hello-World",
+            "github_pat": "fake_test_pat_123",
+        }
+
+        response = test_client.post("/users/testuser/weeks/2024-W21/questions/stream", json=request_data)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        chunks = [json.loads(line.removeprefix("data: ")) for line in response.text.splitlines() if line]
+        assert chunks[-1]["chunk_type"] == "complete"
+        assert chunks[-1]["response"]["question"] == "Which bugs were fixed?"
+        streamed = "".join(chunk["content"] for chunk in chunks if chunk["chunk_type"] == "content")
+        assert streamed
+        assert streamed == chunks[-1]["response"]["answer"]
+
     @pytest.mark.skip(reason="Conversation history persistence is being refactored")
     async def test_conversation_history_endpoints(self, test_client) -> None:
         """Test conversation history API endpoints."""
@@ -0,0 +1,60 @@
+"""Tests for the contributions ingestion service."""
+
+import pytest
+
+from src.ingest import ContributionsIngestionService
+from src.models import CommitContribution
+from tests.test_data import get_test_commit_contribution
+
+
+@pytest.mark.asyncio
+class TestTextContent:
+    """Test extraction and caching of contribution text."""
+
+    async def test_text_content_is_cached_until_reingested(self) -> None:
+        """Text is built once per contribution and rebuilt when it is ingested again."""
+        service = ContributionsIngestionService()
+        commit = CommitContribution.model_validate(get_test_commit_contribution())
+
+        text = service._extract_text_content(commit)
+        assert "Commit: Fix authentication bug" in text
+        assert service._extract_text_content(commit) is text
+
+        updated = commit.model_copy(update={"message": "Fix login bug"})
+        await service._ingest_contributions_content("testuser", "2024-W21", [updated])
+
+        assert "Commit: Fix login bug" in service._extract_text_content(updated)
+
+
+@pytest.mark.asyncio
+class TestKeywordSearch:
+    """Test the in-memory keyword fallback search."""
+
+    async def test_search_ranks_by_matched_query_tokens(self) -> None:
+        """Hits are ordered by the fraction of query tokens they contain."""
+        service = ContributionsIngestionService()
+        commit = CommitContribution.model_validate(get_test_commit_contribution())
+        other = commit.model_copy(update={"id": "commit-456", "message": "Update authentication docs"})
+        await service._ingest_contributions_content("testuser", "2024-W21", [commit, other])
+
+        hits = service.search_contributions("testuser", "2024-W21", "fix authentication bug")
+
+        assert [hit["contribution_id"] for hit in hits] == ["commit-123", "commit-456"]
+        assert hits[0]["relevance_score"] > hits[1]["relevance_score"]
+        assert service.search_contributions("testuser", "2024-W22", "authentication") == []
+        # Punctuation in the question does not stop words from matching
+        assert service.search_contributions("testuser", "2024-W21", "Fix authentication bug?") == hits
+
+    async def test_reingested_contribution_is_reindexed(self) -> None:
+        """Tokens from a contribution's previous version no longer match."""
+        service = ContributionsIngestionService()
+        commit = CommitContribution.model_validate(get_test_commit_contribution())
+        await service._ingest_contributions_content("testuser", "2024-W21", [commit])
+
+        updated = commit.model_copy(update={"message": "Refactor login flow"})
+        await service._ingest_contributions_content("testuser", "2024-W21", [updated])
+
+        assert service.search_contributions("testuser", "2024-W21", "authentication") == []
+        assert [hit["contribution_id"] for hit in service.search_contributions("testuser", "2024-W21", "login")] == [
+            "commit-123"
+        ]
@@ -0,0 +1,51 @@
+"""Tests for the LLM response cache."""
+
+import pytest
+
+from src.llm_cache import LLMCache, make_cache_key
+
+
+class TestCacheKey:
+    """Test cache key derivation."""
+
+    def test_key_is_order_independent(self) -> None:
+        """Keyword order must not change the key."""
+        assert make_cache_key(user="alice", week="2024-W21") == make_cache_key(week="2024-W21", user="alice")
+
+    def test_key_changes_with_parts(self) -> None:
+        """Different inputs must produce different keys."""
+        assert make_cache_key(user="alice", week="2024-W21") != make_cache_key(user="alice", week="2024-W22")
+
+
+@pytest.mark.asyncio
+class TestLLMCache:
+    """Test LRU + TTL behaviour of the LLM cache."""
+
+    async def test_get_returns_stored_value(self) -> None:
+        """A stored value is returned on lookup."""
+        cache = LLMCache("test", max_entries=4)
+        await cache.set("key", "value")
+
+        assert await cache.get("key") == "value"
+        assert await cache.get("missing") is None
+
+    async def test_least_recently_used_entry_is_evicted(self) -> None:
+        """The least recently used entry is dropped once the cache is full."""
+        cache = LLMCache("test", max_entries=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+
+        assert await cache.get("a") == 1
+        assert await cache.get("b") is None
+        assert await cache.get("c") == 3
+        assert len(cache) == 2
+
+    async def test_expired_entry_is_a_miss(self) -> None:
+        """Entries past their TTL are not returned."""
+        cache = LLMCache("test", max_entries=2)
+        await cache.set("key", "value", ttl=0)
+
+        assert await cache.get("key") is None
+        assert len(cache) == 0
@@ -0,0 +1,154 @@
+"""Tests for LLM service helpers."""
+
+from typing import Any
+
+import pytest
+from langchain.chat_models.base import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import tool
+from langchain_ollama import ChatOllama
+from langchain_openai import ChatOpenAI
+from langgraph.prebuilt import create_react_agent
+from pydantic import Field, SecretStr
+
+from src.llm_service import LLM_MAX_CONCURRENCY, LLMService
+
+
+class ToolCallingChatModel(BaseChatModel):
+    """Calls the ``free_slots`` tool once, then answers; records the free concurrency slots per call."""
+
+    free_slots_seen: list[int] = Field(default_factory=list)
+
+    @property
+    def _llm_type(self) -> str:
+        return "tool_calling_test_model"
+
+    def _generate(
+        self, messages: list[BaseMessage], stop: Any = None, run_manager: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        self.free_slots_seen.append(LLMService.concurrency_limit()._value)
+        if len(messages) == 1:
+            message = AIMessage(content="", tool_calls=[{"name": "free_slots", "args": {}, "id": "call-1"}])
+        else:
+            message = AIMessage(content="Done.")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "ToolCallingChatModel":
+        """Tools are implied by the scripted responses."""
+        return self
+
+
+class TestSharedLLM:
+    """Test reuse of LLM instances across services."""
+
+    def test_same_configuration_reuses_instance(self) -> None:
+        """Repeated requests for one configuration return the same instance."""
+        first = LLMService.get_shared_llm(temperature=0.3, timeout=30.0)
+
+        assert LLMService.get_shared_llm(temperature=0.3, timeout=30.0) is first
+        assert LLMService.get_shared_llm(temperature=0.4, timeout=30.0) is not first
+
+
+class TestPromptCacheKey:
+    """Test provider-side prompt cache routing."""
+
+    @pytest.mark.parametrize(
+        ("base_url", "sent"),
+        [
+            (None, True),
+            ("https://api.openai.com/v1", True),
+            ("https://promptheus.openai.azure.com/openai/v1", False),
+            ("http://localhost:4000/v1", False),
+        ],
+    )
+    def test_key_is_only_sent_to_openai(
+        self, monkeypatch: pytest.MonkeyPatch, base_url: str | None, sent: bool
+    ) -> None:
+        """OpenAI-compatible endpoints behind a custom base URL do not get the prompt_cache_key parameter."""
+        monkeypatch.delenv("OPENAI_API_BASE", raising=False)
+        if base_url is None:
+            monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+        else:
+            monkeypatch.setenv("OPENAI_BASE_URL", base_url)
+
+        llm = LLMService._create_openai_llm(
+            "test-key", temperature=0.2, max_tokens=None, timeout=60.0, model_override=None, prompt_cache_key="qa"
+        )
+
+        assert ("prompt_cache_key" in llm.model_kwargs) is sent
+
+
+class TestWithMaxTokens:
+    """Test per-call output token limits."""
+
+    def test_openai_copy_gets_max_tokens(self) -> None:
+        """OpenAI models are capped via max_tokens without mutating the original."""
+        llm = ChatOpenAI(model="gpt-4o-mini", api_key=SecretStr("test-key"))
+
+        capped = LLMService.with_max_tokens(llm, 2500)
+
+        assert capped.max_tokens == 2500
+        assert llm.max_tokens is None
+
+    def test_ollama_copy_gets_num_predict(self) -> None:
+        """Ollama models are capped via num_predict."""
+        llm = ChatOllama(model="llama3.3:latest", num_predict=-1)
+
+        capped = LLMService.with_max_tokens(llm, 2500)
+
+        assert capped.num_predict == 2500
+        assert llm.num_predict == -1
+
+
+class TestConcurrencyLimit:
+    """Test per-model LLM concurrency limits."""
+
+    def test_same_model_shares_semaphore(self) -> None:
+        """Callers of the same model must share one limit."""
+        assert LLMService.concurrency_limit("model-a") is LLMService.concurrency_limit("model-a")
+
+    def test_models_are_limited_independently(self) -> None:
+        """Each model gets its own limit sized from configuration."""
+        semaphore = LLMService.concurrency_limit("model-b")
+
+        assert semaphore is not LLMService.concurrency_limit("model-c")
+        assert semaphore._value == LLM_MAX_CONCURRENCY
+
+
+class TestWithConcurrencyLimit:
+    """Test that agents hold a concurrency slot only during LLM calls."""
+
+    @pytest.mark.asyncio
+    async def test_slot_is_released_during_tool_calls(self) -> None:
+        """Each model call takes a slot; tool calls in between run without one."""
+        tool_free_slots: list[int] = []
+
+        @tool
+        def free_slots() -> str:
+            """Report the free concurrency slots."""
+            tool_free_slots.append(LLMService.concurrency_limit()._value)
+            return "ok"
+
+        llm = ToolCallingChatModel()
+        agent = create_react_agent(model=LLMService.with_concurrency_limit(llm), tools=[free_slots])
+
+        response = await agent.ainvoke({"messages": [("user", "How many slots are free?")]})
+
+        assert response["messages"][-1].content == "Done."
+        assert llm.free_slots_seen == [LLM_MAX_CONCURRENCY - 1, LLM_MAX_CONCURRENCY - 1]
+        assert tool_free_slots == [LLM_MAX_CONCURRENCY]
+
+    def test_provider_tools_are_bound_on_the_wrapper(self) -> None:
+        """Binding tools keeps the wrapper in front of the provider model and forwards the tool schemas."""
+        llm = ChatOpenAI(model="gpt-4o-mini", api_key=SecretStr("test-key"))
+
+        @tool
+        def lookup() -> str:
+            """Look something up."""
+            return ""
+
+        bound = LLMService.with_concurrency_limit(llm).bind_tools([lookup])
+
+        assert bound.bound.llm is llm
+        assert bound.kwargs["tools"][0]["function"]["name"] == "lookup"
@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import UTC, datetime
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -130,3 +131,34 @@ class TestMeilisearchService:
         assert document["author"] == "testuser"
         assert "content" in document
         assert "Test commit message" in document["content"]
+
+
+@pytest.mark.asyncio
+class TestSearchCache:
+    """Test caching of search results between index writes."""
+
+    @pytest.fixture
+    def service(self) -> MeilisearchService:
+        """Create a service whose index returns a fixed hit and counts searches."""
+        service = MeilisearchService()
+        service.contributions_index = MagicMock()
+        service.contributions_index.search.return_value = {
+            "hits": [{"contribution_id": "commit-123", "_rankingScore": 0.75}]
+        }
+        return service
+
+    async def test_repeated_search_is_served_from_cache(self, service: MeilisearchService) -> None:
+        """Equivalent queries for the same week only hit Meilisearch once."""
+        first = await service.search_contributions("testuser", "2024-W21", "auth bug", limit=5)
+        second = await service.search_contributions("testuser", "2024-W21", "  Auth   BUG ", limit=5)
+
+        assert first == second == [{"contribution_id": "commit-123", "relevance_score": 0.75}]
+        assert service.contributions_index.search.call_count == 1
+
+    async def test_write_invalidates_cached_searches(self, service: MeilisearchService) -> None:
+        """Indexing or deleting a week's documents forces a fresh search."""
+        await service.search_contributions("testuser", "2024-W21", "auth bug", limit=5)
+        service._invalidate_search_cache("testuser", "2024-W21")
+        await service.search_contributions("testuser", "2024-W21", "auth bug", limit=5)
+
+        assert service.contributions_index.search.call_count == 2
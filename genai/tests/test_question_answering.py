@@ -1,11 +1,24 @@
 """Tests for Question Answering service functionality."""
 
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import patch
+
 import pytest
 import pytest_asyncio
+from langchain_core.messages import AIMessage, HumanMessage
+from prometheus_client import REGISTRY
+from pydantic import ValidationError
 
+from src.ingest import ContributionsIngestionService
+from src.llm_cache import LLMCache
 from src.meilisearch import MeilisearchService
-from src.models import QuestionContext, QuestionRequest, QuestionResponse, ReasoningDepth
+from src.models import CommitContribution, QuestionContext, QuestionRequest, QuestionResponse, ReasoningDepth
+from src.llm_service import _shared_llms
+from src.question_answering import QA_SYSTEM_PROMPT, compiled_agents
 from src.services import GitHubContentService, QuestionAnsweringService
+from tests.test_data import get_test_commit_contribution
 
 
 @pytest.mark.asyncio
@@ -94,6 +107,297 @@ class TestQuestionAnsweringService:
         assert isinstance(contributions, list)
         assert len(contributions) == 0
 
+    async def test_retrieve_falls_back_to_keyword_search(self) -> None:
+        """Test keyword fallback over ingested contributions when Meilisearch is unavailable."""
+        meilisearch_service = MeilisearchService()  # Not initialized, so every search fails
+        ingestion_service = ContributionsIngestionService(meilisearch_service)
+        await ingestion_service._ingest_contributions_content(
+            "testuser", "2024-W21", [CommitContribution.model_validate(get_test_commit_contribution())]
+        )
+        qa_service = QuestionAnsweringService(
+            GitHubContentService(), meilisearch_service, ingestion_service=ingestion_service
+        )
+        request = QuestionRequest(
+            question="Which authentication bug was fixed?",
+            repository="test/repo",
+            github_pat="fake_pat_for_testing",
+        )
+
+        contributions = await qa_service._retrieve_relevant_contributions(
+            user="testuser", week="2024-W21", request=request
+        )
+
+        assert [hit["contribution_id"] for hit in contributions] == ["commit-123"]
+        assert contributions[0]["title"] == "Fix authentication bug"
+        assert 0 < contributions[0]["relevance_score"] <= 1
+
+    async def test_evidence_xml_is_escaped(self, qa_service) -> None:
+        """Test that evidence text cannot break out of its XML elements."""
+        evidence = await qa_service._build_evidence(
+            [
+                {
+                    "contribution_id": "commit-123",
+                    "contribution_type": "commit",
+                    "title": "Handle <script> & 'quotes'",
+                    "content": 'if a < b: return "ok"',
+                    "created_at": "2024-05-20T10:00:00+00:00",
+                    "relevance_score": 1.0,
+                }
+            ],
+            "What changed?",
+            datetime.now(UTC),
+        )
+
+        xml = qa_service._format_evidence_as_xml(evidence)
+
+        assert "<title>Handle &lt;script&gt; &amp; &apos;quotes&apos;</title>" in xml
+        assert "<excerpt>if a &lt; b: return &quot;ok&quot;</excerpt>" in xml
+        assert xml.startswith("<evidence>\n  <item>")
+        assert xml.endswith("</item>\n</evidence>")
+
+    async def test_near_duplicate_evidence_is_dropped(self, qa_service) -> None:
+        """Test that a hit repeating an earlier hit's content does not become separate evidence."""
+        content = "Repository: octocat/Hello-World\n" + "\n".join(f"File: src/module_{i}.py" for i in range(20))
+        hits = [
+            {"contribution_id": "commit-1", "contribution_type": "commit", "content": content, "relevance_score": 0.9},
+            {"contribution_id": "commit-2", "contribution_type": "commit", "content": content, "relevance_score": 0.8},
+            {"contribution_id": "commit-3", "contribution_type": "commit", "content": "Commit: Fix login bug"},
+        ]
+
+        evidence = await qa_service._build_evidence(hits, "What changed?", datetime.now(UTC))
+
+        assert [item.contribution_id for item in evidence] == ["commit-1", "commit-3"]
+
+    async def test_zero_score_evidence_keeps_an_excerpt(self, qa_service) -> None:
+        """Test that a hit without a relevance score is not reduced to an empty excerpt."""
+        hits = [
+            {
+                "contribution_id": "commit-1",
+                "contribution_type": "commit",
+                "content": "File: src/app.py",
+                "relevance_score": 0.9,
+            },
+            {"contribution_id": "commit-2", "contribution_type": "commit", "content": "Commit: Fix login bug"},
+        ]
+
+        evidence = await qa_service._build_evidence(hits, "What changed?", datetime.now(UTC))
+
+        assert evidence[1].excerpt == "Commit: Fix login bug"
+
+    async def test_cached_response_cannot_be_mutated(self) -> None:
+        """Test that a caller cannot alter the response served to later cache hits."""
+        qa_service = QuestionAnsweringService(
+            GitHubContentService(), MeilisearchService(), cache=LLMCache("test_question_answering")
+        )
+        request = QuestionRequest(question="What was done?", repository="test/repo", github_pat="fake_pat_for_testing")
+
+        first = await qa_service.answer_question("frozenuser", "2024-W21", request)
+        with pytest.raises(ValidationError):
+            first.answer = "tampered"
+
+        # The answer is cached for the conversation state it was given in
+        qa_service.clear_conversation_history("frozenuser", "2024-W21")
+        second = await qa_service.answer_question("frozenuser", "2024-W21", request)
+        assert second.answer == first.answer
+
+    async def test_token_usage_includes_provider_cached_prompt(self, qa_service) -> None:
+        """Test that cached prompt tokens reported by the provider are recorded separately."""
+        labels = {"model": "test-model", "type": "cached_input"}
+        before = REGISTRY.get_sample_value("genai_question_answering_tokens_total_sum", labels) or 0.0
+        message = AIMessage(
+            content="Done",
+            usage_metadata={
+                "input_tokens": 1500,
+                "output_tokens": 100,
+                "total_tokens": 1600,
+                "input_token_details": {"cache_read": 1024},
+            },
+        )
+
+        with patch("src.question_answering.LLMService.get_current_model_name", return_value="test-model"):
+            qa_service._record_token_usage([message])
+
+        assert REGISTRY.get_sample_value("genai_question_answering_tokens_total_sum", labels) == before + 1024
+
+    async def test_concurrent_identical_questions_share_one_agent_run(self) -> None:
+        """Test that identical in-flight questions await the first run instead of invoking the agent again."""
+        qa_service = QuestionAnsweringService(
+            GitHubContentService(), MeilisearchService(), cache=LLMCache("test_question_answering")
+        )
+        prepare_agent = qa_service._prepare_agent
+        calls = []
+
+        def counting_prepare_agent(*args: Any, **kwargs: Any) -> Any:
+            calls.append(args)
+            return prepare_agent(*args, **kwargs)
+
+        qa_service._prepare_agent = counting_prepare_agent
+        request = QuestionRequest(
+            question="What was done?",
+            repository="test/repo",
+            github_pat="fake_pat_for_testing",
+        )
+
+        first, second = await asyncio.gather(
+            qa_service.answer_question("coalesceuser", "2024-W21", request),
+            qa_service.answer_question("coalesceuser", "2024-W21", request),
+        )
+
+        assert len(calls) == 1
+        assert first.answer == second.answer
+        assert first.question_id != second.question_id
+
+    async def test_cached_answer_is_not_shared_across_github_pats(self) -> None:
+        """Test that an answer gathered with one GitHub PAT is not served to a request with another."""
+        qa_service = QuestionAnsweringService(
+            GitHubContentService(), MeilisearchService(), cache=LLMCache("test_question_answering")
+        )
+        prepare_agent = qa_service._prepare_agent
+        calls = []
+
+        def counting_prepare_agent(*args: Any, **kwargs: Any) -> Any:
+            calls.append(args)
+            return prepare_agent(*args, **kwargs)
+
+        qa_service._prepare_agent = counting_prepare_agent
+        for github_pat in ["fake_pat_for_testing", "other_fake_pat"]:
+            request = QuestionRequest(question="What was done?", repository="test/repo", github_pat=github_pat)
+            await qa_service.answer_question("patuser", "2024-W21", request)
+            qa_service.clear_conversation_history("patuser", "2024-W21")
+
+        assert len(calls) == 2
+
+    async def test_cached_answer_is_keyed_by_and_added_to_conversation(self) -> None:
+        """Test that cached answers depend on the thread's history and extend it like an answered turn."""
+        qa_service = QuestionAnsweringService(
+            GitHubContentService(), MeilisearchService(), cache=LLMCache("test_question_answering")
+        )
+        prepare_agent = qa_service._prepare_agent
+        calls = []
+
+        def counting_prepare_agent(*args: Any, **kwargs: Any) -> Any:
+            calls.append(args)
+            return prepare_agent(*args, **kwargs)
+
+        qa_service._prepare_agent = counting_prepare_agent
+        first, follow_up = (
+            QuestionRequest(question=question, repository="test/repo", github_pat="fake_pat_for_testing")
+            for question in ["What was done?", "Why was it done?"]
+        )
+
+        await qa_service.answer_question("historyuser", "2024-W21", first)
+        await qa_service.answer_question("historyuser", "2024-W21", follow_up)
+        qa_service.clear_conversation_history("historyuser", "2024-W21")
+
+        # Without the first turn the follow-up is a different conversation, so the agent runs again
+        await qa_service.answer_question("historyuser", "2024-W21", follow_up)
+        assert len(calls) == 3
+        qa_service.clear_conversation_history("historyuser", "2024-W21")
+
+        # Replaying the same conversation is answered from the cache and recorded in the thread
+        await qa_service.answer_question("historyuser", "2024-W21", first)
+        await qa_service.answer_question("historyuser", "2024-W21", follow_up)
+        assert len(calls) == 3
+
+        history = qa_service.get_conversation_history("historyuser", "2024-W21")
+        assert [message.content for message in history if isinstance(message, HumanMessage)] == [
+            first.question,
+            follow_up.question,
+        ]
+        assert sum(isinstance(message, AIMessage) for message in history) == 2
+        assert [message.content for message in history].count(QA_SYSTEM_PROMPT) == 1
+
+    async def test_compiled_agent_is_reused_across_services(self) -> None:
+        """Test that the agent graph is built once per PAT and token budget, not per request."""
+        first = QuestionAnsweringService(GitHubContentService(), MeilisearchService())
+        second = QuestionAnsweringService(GitHubContentService(), MeilisearchService())
+
+        assert first._get_agent("fake_pat_for_testing", 2000) is second._get_agent("fake_pat_for_testing", 2000)
+        assert first._get_agent("fake_pat_for_testing", 2000) is not first._get_agent("other_pat", 2000)
+        assert not any("fake_pat_for_testing" in key for key in compiled_agents)
+
+    async def test_compiled_agent_is_keyed_by_llm_configuration(self) -> None:
+        """Test that agents are found by LLM configuration, which survives the shared LLM being rebuilt."""
+        first = QuestionAnsweringService(GitHubContentService(), MeilisearchService())
+        agent = first._get_agent("fake_pat_for_testing", 2000)
+
+        _shared_llms.clear()
+        second = QuestionAnsweringService(GitHubContentService(), MeilisearchService())
+
+        assert second.llm is not first.llm
+        assert second._get_agent("fake_pat_for_testing", 2000) is agent
+
+    async def test_follow_up_turn_does_not_resend_prompt_or_evidence(self) -> None:
+        """Test that a follow-up turn only adds new context to the conversation thread."""
+        meilisearch_service = MeilisearchService()  # Not initialized, so retrieval uses keyword search
+        ingestion_service = ContributionsIngestionService(meilisearch_service)
+        await ingestion_service._ingest_contributions_content(
+            "followupuser", "2024-W21", [CommitContribution.model_validate(get_test_commit_contribution())]
+        )
+        cache = LLMCache("test_question_answering")
+
+        # Each request gets its own service instance, as in the API
+        for question in ["Which authentication bug was fixed?", "Why was the authentication bug fixed?"]:
+            qa_service = QuestionAnsweringService(
+                GitHubContentService(), meilisearch_service, cache=cache, ingestion_service=ingestion_service
+            )
+            await qa_service.answer_question(
+                "followupuser",
+                "2024-W21",
+                QuestionRequest(question=question, repository="test/repo", github_pat="fake_pat_for_testing"),
+            )
+
+        contents = [str(message.content) for message in qa_service.get_conversation_history("followupuser", "2024-W21")]
+        assert contents.count(QA_SYSTEM_PROMPT) == 1
+        assert sum("<contribution_id>commit-123</contribution_id>" in content for content in contents) == 1
+        assert any("No new evidence" in content for content in contents)
+
+    async def test_concurrent_turns_on_one_thread_are_all_kept(self, qa_service) -> None:
+        """Test that concurrent questions in one conversation each extend the thread the other committed."""
+        questions = ["What was done?", "Why was it done?", "What comes next?"]
+
+        await asyncio.gather(
+            *(
+                qa_service.answer_question(
+                    "concurrentuser",
+                    "2024-W21",
+                    QuestionRequest(question=question, repository="test/repo", github_pat="fake_pat_for_testing"),
+                )
+                for question in questions
+            )
+        )
+
+        history = qa_service.get_conversation_history("concurrentuser", "2024-W21")
+        assert sorted(message.content for message in history if isinstance(message, HumanMessage)) == sorted(questions)
+        assert sum(isinstance(message, AIMessage) for message in history) == len(questions)
+        assert [message.content for message in history].count(QA_SYSTEM_PROMPT) == 1
+
+    async def test_turn_after_failed_turn_does_not_resend_prompt(self, qa_service) -> None:
+        """Test that the thread left by a failed turn is continued rather than started again."""
+        request = QuestionRequest(question="What was done?", repository="test/repo", github_pat="fake_pat_for_testing")
+
+        with (
+            patch.object(type(qa_service.llm), "_agenerate", side_effect=RuntimeError("model unavailable")),
+            pytest.raises(RuntimeError),
+        ):
+            await qa_service.answer_question("faileduser", "2024-W21", request)
+        await qa_service.answer_question("faileduser", "2024-W21", request)
+
+        history = qa_service.get_conversation_history("faileduser", "2024-W21")
+        assert [message.content for message in history].count(QA_SYSTEM_PROMPT) == 1
+        assert isinstance(history[-1], AIMessage)
+
+    async def test_least_recently_active_conversation_is_dropped(self, qa_service) -> None:
+        """Test that only the most recently active conversation threads are kept in memory."""
+        request = QuestionRequest(question="What was done?", repository="test/repo", github_pat="fake_pat_for_testing")
+
+        with patch("src.question_answering.QA_MAX_CONVERSATIONS", 1):
+            await qa_service.answer_question("lruuser1", "2024-W21", request)
+            await qa_service.answer_question("lruuser2", "2024-W21", request)
+
+        assert qa_service.get_conversation_history("lruuser1", "2024-W21") == []
+        assert len(qa_service.get_conversation_history("lruuser2", "2024-W21")) > 0
+
     async def test_answer_question_no_contributions(self, qa_service) -> None:
         """Test answering question when no contributions are found."""
         request = QuestionRequest(
@@ -150,7 +454,6 @@ class TestQuestionAnsweringService:
         assert isinstance(response.response_time_ms, int)
         assert response.response_time_ms > 0
 
-    @pytest.mark.skip(reason="Conversation history persistence is being refactored")
     async def test_conversation_context_functionality(self, qa_service) -> None:
         """Test LangChain conversation context features."""
         user = "testuser"
@@ -187,7 +490,6 @@ class TestQuestionAnsweringService:
         history = qa_service.get_conversation_history(user, week)
         assert len(history) >= 2  # At least 2 messages (human + AI from first question)
 
-    @pytest.mark.skip(reason="Conversation history persistence is being refactored")
     async def test_conversation_history_management(self, qa_service) -> None:
         """Test conversation history retrieval and clearing."""
         user = "testuser2"
@@ -218,7 +520,6 @@ class TestQuestionAnsweringService:
         history = qa_service.get_conversation_history(user, week)
         assert len(history) == 0
 
-    @pytest.mark.skip(reason="Conversation history persistence is being refactored")
     async def test_separate_conversation_sessions(self, qa_service) -> None:
         """Test that different user/week combinations have separate conversations."""
         # Ask questions for different user/week combinations
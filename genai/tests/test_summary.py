@@ -0,0 +1,202 @@
+"""Tests for the summary service."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+
+from src.ingest import ContributionsIngestionService
+from src.llm_cache import LLMCache
+from src.llm_service import LLM_MAX_CONCURRENCY, LLMService
+from src.models import CommitContribution, ContributionType, PullRequestContribution, ReleaseContribution
+from src.summary import PROMPT_CONTRIBUTION_LIMITS, SummaryService, WeeklyProgressOutput
+from tests.test_data import (
+    get_test_commit_contribution,
+    get_test_pull_request_contribution,
+    get_test_release_contribution,
+)
+
+REPORT = WeeklyProgressOutput(
+    summary="Fixed a bug.", key_accomplishments=[], impediments=[], next_steps=[], analysis="Solid."
+)
+
+
+class FakeReportChain:
+    """Stands in for the structured output chain, returning the next report (or raising) per call."""
+
+    def __init__(self, *results: WeeklyProgressOutput | Exception) -> None:
+        self.results = list(results)
+        self.calls = 0
+
+    async def ainvoke(self, inputs: dict[str, Any]) -> WeeklyProgressOutput:
+        """Return the next result."""
+        result = self.results[min(self.calls, len(self.results) - 1)]
+        self.calls += 1
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class FakeReportModel:
+    """Stands in for the tool-calling model, streaming a report's JSON a few characters per chunk."""
+
+    def __init__(self, report: WeeklyProgressOutput, finish_reason: str = "stop") -> None:
+        self.arguments = report.model_dump_json()
+        self.finish_reason = finish_reason
+        self.calls = 0
+
+    async def astream(self, inputs: dict[str, Any]) -> AsyncIterator[AIMessageChunk]:
+        """Yield tool call chunks, then a last chunk carrying the finish reason."""
+        self.calls += 1
+        for start in range(0, len(self.arguments), 5):
+            yield AIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    {
+                        "name": WeeklyProgressOutput.__name__ if start == 0 else None,
+                        "args": self.arguments[start : start + 5],
+                        "id": "call-1" if start == 0 else None,
+                        "index": 0,
+                    }
+                ],
+            )
+        yield AIMessageChunk(content="", response_metadata={"finish_reason": self.finish_reason})
+
+
+class TestContributionFormatting:
+    """Test the prompt text and metadata derived from contributions."""
+
+    def test_prompt_lines_and_counts_follow_contribution_type(self) -> None:
+        """Each contribution is formatted and counted according to its type."""
+        service = SummaryService(ContributionsIngestionService())
+        commit = CommitContribution.model_validate(get_test_commit_contribution())
+        contributions = [
+            commit,
+            commit.model_copy(update={"id": "commit-456"}),
+            PullRequestContribution.model_validate(get_test_pull_request_contribution()),
+            ReleaseContribution.model_validate(get_test_release_contribution()),
+        ]
+
+        contributions_summary, metadata = service._scan_contributions(contributions, "2024-W21")
+        lines = contributions_summary.splitlines()
+
+        assert [line.split(" in ")[0] for line in lines] == ["COMMIT", "COMMIT", "PULL REQUEST", "RELEASE"]
+        assert (metadata.commits_count, metadata.pull_requests_count, metadata.issues_count) == (2, 1, 0)
+        assert metadata.releases_count == 1
+        assert metadata.total_contributions == 4
+        assert service._scan_contributions([], "2024-W21")[0] == "No detailed contribution data available."
+
+    def test_prompt_lists_largest_contributions_beyond_type_limit(self) -> None:
+        """Past a type's prompt limit only its largest contributions are listed; metadata still counts all."""
+        service = SummaryService(ContributionsIngestionService())
+        commit = CommitContribution.model_validate(get_test_commit_contribution())
+        commits = [
+            commit.model_copy(
+                update={
+                    "id": f"commit-{i}",
+                    "message": f"Change {i}",
+                    "stats": commit.stats.model_copy(update={"total": i}),
+                }
+            )
+            for i in range(PROMPT_CONTRIBUTION_LIMITS[ContributionType.COMMIT] + 2)
+        ]
+
+        contributions_summary, metadata = service._scan_contributions(commits, "2024-W21")
+        lines = contributions_summary.splitlines()
+
+        assert [line.rsplit(" ", 1)[-1] for line in lines[:-1]] == [str(i) for i in range(2, len(commits))]
+        assert lines[-1] == "(and 2 smaller commits not listed)"
+        assert metadata.commits_count == len(commits)
+
+
+@pytest.mark.asyncio
+class TestProgressReport:
+    """Test structured progress report generation."""
+
+    async def test_unchanged_contributions_reuse_cached_report(self) -> None:
+        """The LLM runs once per distinct contributions summary; failures are not cached."""
+        service = SummaryService(ContributionsIngestionService(), cache=LLMCache("test"))
+        service.progress_report_chain = FakeReportChain(RuntimeError("LLM unavailable"), REPORT)
+        contributions_summary = "COMMIT in test/repo: Fix authentication bug"
+
+        fallback = await service._generate_progress_report("testuser", "2024-W21", contributions_summary, 1)
+        first = await service._generate_progress_report("testuser", "2024-W21", contributions_summary, 1)
+        second = await service._generate_progress_report("testuser", "2024-W21", contributions_summary, 1)
+
+        assert fallback.summary != REPORT.summary
+        assert first is REPORT
+        assert second is REPORT
+        assert service.progress_report_chain.calls == 2
+
+    async def test_reordered_contributions_share_cached_report(self) -> None:
+        """Summaries listing the same contributions in another order or case hit the cache."""
+        service = SummaryService(ContributionsIngestionService(), cache=LLMCache("test"))
+        service.progress_report_chain = FakeReportChain(REPORT)
+
+        await service._generate_progress_report("testuser", "2024-W21", "COMMIT in a: Fix bug\nISSUE in a: Crash", 2)
+        await service._generate_progress_report("testuser", "2024-W21", "ISSUE in a: crash\nCOMMIT in a: Fix bug.", 2)
+        await service._generate_progress_report("testuser", "2024-W21", "COMMIT in a: Fix other bug", 1)
+
+        assert service.progress_report_chain.calls == 2
+
+    async def test_stream_sends_analysis_as_it_grows(self) -> None:
+        """The stream sends metadata first, then the report sections and analysis lines, then the summary."""
+        ingestion_service = ContributionsIngestionService()
+        commit = CommitContribution.model_validate(get_test_commit_contribution())
+        await ingestion_service._ingest_contributions_content("testuser", "2024-W21", [commit])
+        service = SummaryService(ingestion_service, cache=LLMCache("test"))
+        service.progress_report_model = FakeReportModel(
+            REPORT.model_copy(update={"analysis": "Solid work.\nTests pass."})
+        )
+
+        with patch("src.summary.SUMMARY_STREAM_PARSE_INTERVAL", 1):
+            chunks = [chunk async for chunk in service.generate_summary_stream("testuser", "2024-W21")]
+
+        assert [(chunk.chunk_type, chunk.section, chunk.content) for chunk in chunks[:-1]] == [
+            ("metadata", None, "1 contributions"),
+            ("section", "overview", "Fixed a bug."),
+            ("section", "analysis", ""),
+            ("content", "analysis", "Solid work.\n"),
+            ("content", "analysis", "Tests pass."),
+        ]
+        assert chunks[-1].chunk_type == "complete"
+        assert chunks[-1].summary is not None
+        assert chunks[-1].summary.analysis == "Solid work.\nTests pass."
+        assert chunks[-1].summary.generated_at == chunks[-1].summary.metadata.generated_at
+
+    async def test_only_finished_stream_is_cached(self) -> None:
+        """A stream cut off at the token limit ends with the fallback and is retried; a finished one is cached."""
+        service = SummaryService(ContributionsIngestionService(), cache=LLMCache("test"))
+        service.progress_report_chain = FakeReportChain(REPORT)
+        contributions_summary = "COMMIT in test/repo: Fix authentication bug"
+
+        service.progress_report_model = FakeReportModel(REPORT, finish_reason="length")
+        truncated = [
+            report async for report in service._stream_progress_report("testuser", "2024-W21", contributions_summary, 1)
+        ]
+        service.progress_report_model = FakeReportModel(REPORT)
+        finished = [
+            report async for report in service._stream_progress_report("testuser", "2024-W21", contributions_summary, 1)
+        ]
+        cached = await service._generate_progress_report("testuser", "2024-W21", contributions_summary, 1)
+
+        assert truncated[-1].summary != REPORT.summary
+        assert finished[-1] == REPORT
+        assert cached == REPORT
+        assert service.progress_report_chain.calls == 0
+
+    async def test_paused_stream_does_not_hold_llm_slot(self) -> None:
+        """Once the model has finished, its slot is free even if the consumer has not read the whole stream."""
+        service = SummaryService(ContributionsIngestionService(), cache=LLMCache("test"))
+        service.progress_report_model = FakeReportModel(REPORT)
+        stream = service._stream_progress_report("testuser", "2024-W21", "COMMIT in test/repo: Fix bug", 1)
+
+        with patch("src.summary.SUMMARY_STREAM_PARSE_INTERVAL", 1):
+            await anext(stream)
+            await asyncio.sleep(0)
+
+        assert LLMService.concurrency_limit()._value == LLM_MAX_CONCURRENCY
+        await stream.aclose()
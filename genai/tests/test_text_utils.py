@@ -0,0 +1,21 @@
+"""Tests for the shared text helpers."""
+
+from src.text_utils import normalize_text, tokenize_words
+
+
+class TestNormalizeText:
+    """Test free-text normalization for cache keys."""
+
+    def test_rephrased_punctuation_and_case_normalize_equal(self) -> None:
+        """Questions differing only in case, punctuation or spacing share a key."""
+        assert normalize_text("What was done?") == normalize_text("  what was DONE ")
+        assert normalize_text("Which bugs were fixed?") != normalize_text("Which bugs were not fixed?")
+
+
+class TestTokenizeWords:
+    """Test word splitting for keyword matching."""
+
+    def test_punctuation_separates_words(self) -> None:
+        """Punctuation and symbols are not part of words, so "bug?" matches "bug"."""
+        assert tokenize_words("Fixed the auth-token bug?") == ["fixed", "the", "auth", "token", "bug"]
+        assert tokenize_words("src/llm_cache.py") == ["src", "llm_cache", "py"]
@@ -0,0 +1,102 @@
+"""Tests for token budgeting helpers."""
+
+from unittest.mock import patch
+
+from src.text_utils import tokenize_words
+from src.token_budget import (
+    CHARS_PER_TOKEN,
+    allocate_token_budget,
+    count_tokens,
+    count_tokens_batch,
+    get_encoding,
+    select_relevant_lines,
+    truncate_to_tokens,
+)
+
+
+class TestAllocateTokenBudget:
+    """Test proportional budget allocation."""
+
+    def test_budget_follows_weights(self) -> None:
+        """Higher weights receive proportionally more tokens."""
+        assert allocate_token_budget([3.0, 1.0], 800) == [600, 200]
+
+    def test_zero_weights_split_evenly(self) -> None:
+        """Without any weight the budget is shared equally."""
+        assert allocate_token_budget([0.0, 0.0], 800) == [400, 400]
+        assert allocate_token_budget([], 800) == []
+
+    def test_zero_weight_item_gets_minimum(self) -> None:
+        """Items without weight still get the minimum, and the rest follows the weights."""
+        assert allocate_token_budget([3.0, 0.0], 800) == [800, 0]
+        assert allocate_token_budget([3.0, 0.0], 800, min_tokens=100) == [700, 100]
+        assert allocate_token_budget([0.0, 0.0], 800, min_tokens=100) == [400, 400]
+
+
+class TestGetEncoding:
+    """Test encoding loading."""
+
+    def test_failed_load_is_retried(self) -> None:
+        """A failed load returns ``None`` without being memoized, so the next call loads the encoding."""
+        encoding = object()
+        with patch("tiktoken.encoding_for_model", side_effect=[ConnectionError("offline"), encoding]) as load:
+            assert get_encoding("retry-test-model") is None
+            assert get_encoding("retry-test-model") is encoding
+            assert get_encoding("retry-test-model") is encoding
+
+        assert load.call_count == 2
+
+
+class TestTruncateToTokens:
+    """Test token-aware truncation."""
+
+    def test_short_text_is_unchanged(self) -> None:
+        """Text within budget is returned as-is."""
+        assert truncate_to_tokens("Fix authentication bug", 100, "gpt-4o-mini") == "Fix authentication bug"
+
+    def test_long_text_is_cut_to_budget(self) -> None:
+        """Text over budget is truncated to roughly the token limit."""
+        text = "word " * 1000
+
+        truncated = truncate_to_tokens(text, 50, "gpt-4o-mini")
+
+        assert text.startswith(truncated)
+        encoding = get_encoding("gpt-4o-mini")
+        if encoding is None:
+            assert len(truncated) == 50 * CHARS_PER_TOKEN
+        else:
+            assert len(encoding.encode(truncated)) <= 50
+
+
+class TestSelectRelevantLines:
+    """Test question-aware excerpt selection."""
+
+    def test_lines_matching_the_query_are_kept(self) -> None:
+        """Over budget, the header and the lines mentioning query words survive in order."""
+        filler = [f"File: src/module_{i}.py" for i in range(50)]
+        text = "\n".join(["Repository: octocat/Hello-World", *filler, "Changes: fix token refresh in login"])
+
+        excerpt = select_relevant_lines(text, frozenset(tokenize_words("How was login fixed?")), 40, "gpt-4o-mini")
+
+        lines = excerpt.splitlines()
+        assert lines[0] == "Repository: octocat/Hello-World"
+        assert "Changes: fix token refresh in login" in lines
+        assert count_tokens(excerpt, "gpt-4o-mini") <= 40
+
+    def test_unrelated_text_falls_back_to_truncation(self) -> None:
+        """Without any matching line the head of the text is kept."""
+        text = "word " * 1000
+
+        assert select_relevant_lines(text, frozenset({"login"}), 50, "gpt-4o-mini") == truncate_to_tokens(
+            text, 50, "gpt-4o-mini"
+        )
+
+
+class TestCountTokensBatch:
+    """Test batched token counting."""
+
+    def test_batch_matches_single_counts(self) -> None:
+        """Counting in one batch gives the same result as counting each text."""
+        texts = ["Fix authentication bug", "", "word " * 100]
+
+        assert count_tokens_batch(texts, "gpt-4o-mini") == [count_tokens(text, "gpt-4o-mini") for text in texts]
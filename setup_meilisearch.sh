@@ -13,6 +13,9 @@ OLLAMA_API_KEY="${OLLAMA_API_KEY:-}"
 OPENAI_API_KEY="${OPENAI_API_KEY:-}"
 OPENAI_EMBEDDING_MODEL="${OPENAI_EMBEDDING_MODEL:-text-embedding-3-small}"
 OPENAI_EMBEDDING_DIMENSIONS="${OPENAI_EMBEDDING_DIMENSIONS:-1536}"
+# Opt-in: store embeddings as 1 bit per dimension; cannot be turned off again without recreating the embedder.
+# Compare semantic search recall@k against a full-precision index on real questions before enabling it.
+MEILISEARCH_BINARY_QUANTIZED="${MEILISEARCH_BINARY_QUANTIZED:-false}"
 
 # Colors for output
 RED='\033[0;31m'
@@ -107,6 +110,7 @@ configure_index_settings() {
                 \"model\": \"${OPENAI_EMBEDDING_MODEL}\",
                 \"dimensions\": ${OPENAI_EMBEDDING_DIMENSIONS:-1536},
                 \"apiKey\": \"${OPENAI_API_KEY}\",
+                \"binaryQuantized\": ${MEILISEARCH_BINARY_QUANTIZED},
                 \"documentTemplate\": \"Repository: {{doc.repository}} Author: {{doc.author}} Type: {{doc.contribution_type}} Title: {{doc.title}} Content: {{doc.content}}\"
             }
         },"
@@ -119,6 +123,7 @@ configure_index_settings() {
                 \"url\": \"${OLLAMA_BASE_URL}/api/embeddings\",
                 \"request\": {\"model\": \"${OLLAMA_EMBEDDING_MODEL}\", \"prompt\": \"{{text}}\"},
                 \"response\": {\"embedding\": \"{{embedding}}\"},
+                \"binaryQuantized\": ${MEILISEARCH_BINARY_QUANTIZED},
                 \"headers\": {
                     \"Authorization\": \"Bearer ${OLLAMA_API_KEY}\",
                     \"Content-Type\": \"application/json\"